@@ -7,6 +7,8 @@ from salary_employee import SalaryEmployee
 # Class(s)
 # ---------------------------------------------------------------------------------------------------------------------
 class CommissionEmployee(SalaryEmployee):
+  __slots__ = ('sales_number', 'commission_rate')
+
   def __init__(self, first_name, last_name, salary, sales_number, commission_rate):
     super().__init__(first_name, last_name, salary)
 
@@ -2,16 +2,31 @@
 # import(s)
 # ---------------------------------------------------------------------------------------------------------------------
 # NOTE: 'employee' refers to the file name 'employee.py' and 'Employee' refers to the class name 'employee.py -> Employee'
-from employee import Employee
-from typing   import List # NOTE: needed this to help with explicit typing of self.employees: List[Employee] = []
+from employee       import Employee
+from payroll_engine import PayrollEngine, PayrollResults, RunningTotal
+from typing         import Dict, List, Tuple # NOTE: needed this to help with explicit typing of -> Tuple[Employee, ...]
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Class(s)
 # ---------------------------------------------------------------------------------------------------------------------
 class Company:
+  """
+  Roster with secondary indexes, all kept up to date by add_employee() / remove_employee() / update_employee():
+  - by id        : get_employee(), duplicates are refused
+  - by last name : find_by_last_name()
+  - by type      : employees_of_type(), plus a running weekly payroll total per type (payroll_by_type())
+  NOTE: 'employees' is a read-only snapshot (a tuple), add and remove employees through the methods above. The indexes
+        hold each employee's last name and paycheck as of its last add/update, so a field set directly
+        (employee.salary = 60000) reaches them with the next update_employee().
+  """
   def __init__(self, company_name = None):
     #self.employees = []                 # NOTE: not explicitly typing, does not give access to the Employee intellisense
-    self.employees: List[Employee] = [] # Explicit reference to force Pylance to recognize Employee
+    self._by_id: Dict[int, Employee] = {}   # NOTE: dicts keep insertion order, this doubles as the roster itself
+    self._by_last_name: Dict[str, Dict[int, Employee]] = {}
+    self._by_type: Dict[type, Dict[int, Employee]] = {}
+    self._payroll_by_type: Dict[type, RunningTotal] = {}
+    self._indexed: Dict[int, Tuple[str, float]] = {}   # NOTE: id -> (last name, paycheck) as _index() filed them
+    self._next_id = 1
     self.name = company_name
 
   @classmethod
@@ -20,25 +35,108 @@ class Company:
     instance.name = company_name
     return instance
 
-  def add_employee(self, employee) -> None:
-    self.employees.append(employee)
-  
+  @property
+  def employees(self) -> Tuple[Employee, ...]: # Explicit reference to force Pylance to recognize Employee
+    return tuple(self._by_id.values())
+
+  def __len__(self) -> int:
+    return len(self._by_id)
+
+  # -------------------------------------------------------
+  def _index(self, employee: Employee) -> None:
+    employee_id = employee.employee_id
+    paycheck    = employee.calculate_weekly_paycheck() or 0
+    self._by_last_name.setdefault(employee.last_name, {})[employee_id] = employee
+    self._by_type.setdefault(type(employee), {})[employee_id] = employee
+    self._payroll_by_type.setdefault(type(employee), RunningTotal()).add(paycheck)
+    self._indexed[employee_id] = (employee.last_name, paycheck)
+
+  def _unindex(self, employee: Employee) -> None:
+    # NOTE: removes exactly what _index() filed, the employee's fields may have been set directly since
+    employee_id         = employee.employee_id
+    last_name, paycheck = self._indexed.pop(employee_id)
+    for index, key in ((self._by_last_name, last_name), (self._by_type, type(employee))):
+      bucket = index[key]
+      del bucket[employee_id]
+      if not bucket:
+        del index[key]
+    self._payroll_by_type[type(employee)].add(-paycheck)
+
+  # -------------------------------------------------------
+  def add_employee(self, employee) -> int:
+    """Adds the employee and returns its id (the one it already has, or the next free one)."""
+    if employee.employee_id is None:
+      while self._next_id in self._by_id:
+        self._next_id += 1
+      employee.employee_id = self._next_id
+    elif employee.employee_id in self._by_id:
+      raise ValueError(f'duplicate employee id {employee.employee_id}')
+
+    self._by_id[employee.employee_id] = employee
+    self._index(employee)
+    return employee.employee_id
+
+  def remove_employee(self, employee_id: int) -> Employee:
+    employee = self._by_id.pop(employee_id)   # NOTE: KeyError for unknown ids
+    self._unindex(employee)
+    return employee
+
+  def update_employee(self, employee_id: int, **fields) -> Employee:
+    """Changes fields (e.g. last_name = 'Smith', salary = 60000) and re-indexes the employee."""
+    employee = self._by_id[employee_id]
+    if 'employee_id' in fields:
+      raise ValueError('employee ids cannot be changed, remove and add the employee instead')
+
+    self._unindex(employee)
+    try:
+      for name, value in fields.items():
+        setattr(employee, name, value)
+    finally:
+      self._index(employee)
+    return employee
+
+  # -------------------------------------------------------
+  def get_employee(self, employee_id: int) -> Employee:
+    return self._by_id[employee_id]
+
+  def find_by_last_name(self, last_name: str) -> List[Employee]:
+    return list(self._by_last_name.get(last_name, {}).values())
+
+  def employees_of_type(self, employee_type: type) -> List[Employee]:
+    return list(self._by_type.get(employee_type, {}).values())
+
+  def payroll_by_type(self) -> Dict[str, float]:
+    """Total weekly payroll per employee type, from the running totals (no walk over the roster)."""
+    return {employee_type.__name__: total.value()
+            for employee_type, total in self._payroll_by_type.items() if employee_type in self._by_type}
+
+  # -------------------------------------------------------
   def display_employees(self):
     print('-- Current Employees -------------------------')
 
-    for employee in self.employees:
+    for employee in self._by_id.values():
       print(' -', employee.first_name, employee.last_name)
 
     print()
 
-  def pay_employees(self):
+  def pay_employees(self, display = True) -> PayrollResults:
+    # NOTE: paychecks are computed per employee type in one pass (payroll_engine.py), not one method call per
+    #       employee. The columns are read from the employee objects on every run, so fields set directly
+    #       (employee.salary = 60000) are always paid. display = False skips the printing, which is what dominates on
+    #       big payrolls.
+    results = PayrollEngine(self._by_id.values()).run()
+    if not display:
+      return results
+
     print('-- Paying Employees --------------------------')
 
-    for employee in self.employees:
-      print('Paycheck for:', employee.first_name, employee.last_name)
-      print(f'  Amount: ${employee.calculate_weekly_paycheck():,.2f}')
+    for first_name, last_name, amount in results:
+      print('Paycheck for:', first_name, last_name)
+      print(f'  Amount: ${amount:,.2f}')
       print('----------------------------------------------')
-  
+
+    return results
+
 # ---------------------------------------------------------
-   
+
 # ---------------------------------------------------------
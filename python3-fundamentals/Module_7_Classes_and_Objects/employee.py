@@ -2,9 +2,12 @@
 # Class(s)
 # ---------------------------------------------------------------------------------------------------------------------
 class Employee:
+  __slots__ = ('first_name', 'last_name', 'employee_id')   # NOTE: no per-instance __dict__, about half the memory
+
   def __init__(self, first_name, last_name):
     self.first_name = first_name
     self.last_name = last_name
+    self.employee_id = None   # NOTE: Company.add_employee() hands out the next free id unless one is set beforehand
     pass
 
   def calculate_weekly_paycheck(self):
@@ -1,6 +1,9 @@
 # ---------------------------------------------------------------------------------------------------------------------
 # import(s)
 # ---------------------------------------------------------------------------------------------------------------------
+import argparse
+import os
+
 # NOTE: 'company' refers to the file name 'company.py' and 'Company' refers to the class name 'company.py -> Company'
 from company import Company
 
@@ -8,6 +11,9 @@ from hourly_employee      import HourlyEmployee
 from salary_employee      import SalaryEmployee
 from commission_employee  import CommissionEmployee
 
+from payroll_io       import DEFAULT_CHUNK_SIZE, RosterWriter, stream_payroll
+from payroll_parallel import parallel_stream_payroll
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Function(s)
 # ---------------------------------------------------------------------------------------------------------------------
@@ -32,10 +38,52 @@ def main():
   my_company.display_employees()
   my_company.pay_employees()
 
+# ---------------------------------------------------------
+def generate_roster(path: str, count: int) -> None:
+  """Writes a synthetic roster of 'count' employees, to try the streaming pay run on big files."""
+  with RosterWriter(path) as roster:
+    for i in range(count):
+      if i % 3 == 0:
+        employee = SalaryEmployee(f'First{i % 500}', f'Last{i % 20_000}', 40000 + i % 5000)
+      elif i % 3 == 1:
+        employee = HourlyEmployee(f'First{i % 500}', f'Last{i % 20_000}', 20 + i % 30, 15 + i % 40)
+      else:
+        employee = CommissionEmployee(f'First{i % 500}', f'Last{i % 20_000}', 30000, i % 50, 150)
+      employee.employee_id = i + 1
+      roster.write(employee)
+
+  print(f"Wrote {count:,} employee(s) to '{path}'")
+
+# ---------------------------------------------------------
+def pay_from_file(roster_path: str, paycheck_path: str, chunk_size: int, workers: int = 1) -> None:
+  if workers > 1:
+    result = parallel_stream_payroll(roster_path, paycheck_path, workers, chunk_size)
+  else:
+    result = stream_payroll(roster_path, paycheck_path, chunk_size)
+  print(f"Paid {result.rows:,} employee(s), ${result.total:,.2f} in total -> '{paycheck_path}'")
+  print(f'  {result.seconds:.2f}s, {result.rows_per_second:,.0f} rows/sec')
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Main Program
 # ---------------------------------------------------------------------------------------------------------------------
-main()
+# NOTE: guarded, because the process pool used by --workers re-imports this file in its workers on some platforms
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Pay the example company, or every employee in a roster file.')
+  parser.add_argument('roster', nargs='?', help='roster file (.csv or .jsonl), read in chunks')
+  parser.add_argument('--paychecks', help='where to write the paychecks (default: <roster>_paychecks.<ext>)')
+  parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='employees held in memory at a time')
+  parser.add_argument('--workers', type=int, default=1, help='shard the roster across this many processes')
+  parser.add_argument('--generate', type=int, metavar='N', help='write a synthetic roster of N employees to ROSTER')
+  arguments = parser.parse_args()
+
+  if arguments.roster is None:
+    main()
+  elif arguments.generate:
+    generate_roster(arguments.roster, arguments.generate)
+  else:
+    root, extension = os.path.splitext(arguments.roster)
+    pay_from_file(arguments.roster, arguments.paychecks or f'{root}_paychecks{extension}', arguments.chunk_size,
+                  arguments.workers)
 
 
 # ---------------------------------------------------------
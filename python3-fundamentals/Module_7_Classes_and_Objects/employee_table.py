@@ -0,0 +1,148 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import gc
+import time
+import tracemalloc
+
+from array  import array
+from typing import Dict, Iterator, List
+
+from employee            import Employee
+from salary_employee     import SalaryEmployee
+from hourly_employee     import HourlyEmployee
+from commission_employee import CommissionEmployee
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: one row per employee. The type is a 1 byte code, the employee id 8 bytes, names are 4 byte ids into a table of
+#       unique strings, and every numeric field is a float64 column (fields a type does not have are left at 0).
+TYPE_CODES: Dict[type, int] = { SalaryEmployee    : 1
+                               ,HourlyEmployee    : 2
+                               ,CommissionEmployee: 3 }
+TYPES_BY_CODE = {code: employee_type for employee_type, code in TYPE_CODES.items()}
+
+FIELDS = { SalaryEmployee    : ('salary',)
+          ,HourlyEmployee    : ('weekly_hours', 'hourly_rate')
+          ,CommissionEmployee: ('salary', 'sales_number', 'commission_rate') }   # NOTE: in constructor order
+
+COLUMN_NAMES = ('salary', 'hourly_rate', 'weekly_hours', 'sales_number', 'commission_rate')
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+class EmployeeTable:
+  """
+  Struct-of-arrays roster: the same add_employee() / iteration API as Company.employees, but the fields live in
+  typed arrays instead of one Python object per employee.
+  - iterating (or indexing) builds a regular employee object for that row on the fly
+  - numeric fields come back as floats, so 50000 is returned as 50000.0 (paychecks compare equal)
+  """
+  def __init__(self, employees = ()):
+    self.types       = array('B')
+    self.ids         = array('q')   # NOTE: -1 for employees without an id
+    self.first_names = array('I')
+    self.last_names  = array('I')
+    self.columns: Dict[str, array] = {name: array('d') for name in COLUMN_NAMES}
+
+    self._strings: List[str] = []
+    self._string_ids: Dict[str, int] = {}
+
+    for employee in employees:
+      self.add_employee(employee)
+
+  # -------------------------------------------------------
+  def _string_id(self, text: str) -> int:
+    string_id = self._string_ids.get(text)
+    if string_id is None:
+      string_id = self._string_ids[text] = len(self._strings)
+      self._strings.append(text)
+    return string_id
+
+  # -------------------------------------------------------
+  def add_employee(self, employee: Employee) -> None:
+    code = TYPE_CODES.get(type(employee))
+    if code is None:
+      raise TypeError(f'EmployeeTable cannot store {type(employee).__name__} employees')
+
+    self.types.append(code)
+    self.ids.append(-1 if employee.employee_id is None else employee.employee_id)
+    self.first_names.append(self._string_id(employee.first_name))
+    self.last_names.append(self._string_id(employee.last_name))
+    for name, column in self.columns.items():
+      column.append(getattr(employee, name, 0))
+
+  # -------------------------------------------------------
+  def __len__(self) -> int:
+    return len(self.types)
+
+  def __getitem__(self, row: int) -> Employee:
+    employee_type = TYPES_BY_CODE[self.types[row]]
+    fields        = [self.columns[name][row] for name in FIELDS[employee_type]]
+    employee      = employee_type(self._strings[self.first_names[row]], self._strings[self.last_names[row]], *fields)
+    if self.ids[row] >= 0:
+      employee.employee_id = self.ids[row]
+    return employee
+
+  def __iter__(self) -> Iterator[Employee]:
+    for row in range(len(self.types)):
+      yield self[row]
+
+  # -------------------------------------------------------
+  def nbytes(self) -> int:
+    """Bytes held by the arrays (the unique name strings are not included)."""
+    arrays = [self.types, self.ids, self.first_names, self.last_names, *self.columns.values()]
+    return sum(values.itemsize * len(values) for values in arrays)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+  EMPLOYEE_COUNT = 1_000_000
+
+  class DictEmployee:
+    """Stand-in for the original (pre __slots__) classes: same attributes, stored in a per-instance __dict__."""
+    def __init__(self, first_name, last_name, **fields):
+      self.first_name = first_name
+      self.last_name  = last_name
+      self.__dict__.update(fields)
+
+  def make_rows():
+    # NOTE: names are built per row, like they would be when read from a file, so each row gets its own string objects
+    for i in range(EMPLOYEE_COUNT):
+      first, last = f'First{i % 500}', f'Last{i % 20_000}'
+      if i % 3 == 0:
+        salary = 40000 + i % 5000
+        yield SalaryEmployee, (first, last, salary), {'salary': salary}
+      elif i % 3 == 1:
+        hours, rate = 20 + i % 30, 15 + i % 40
+        yield HourlyEmployee, (first, last, hours, rate), {'weekly_hours': hours, 'hourly_rate': rate}
+      else:
+        sales = i % 50
+        yield CommissionEmployee, (first, last, 30000, sales, 150), { 'salary': 30000, 'sales_number': sales
+                                                                     ,'commission_rate': 150 }
+
+  def measure(label: str, build) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start   = time.perf_counter()
+    roster  = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<28}: {size / 2**20:8,.1f} MiB  ({size / EMPLOYEE_COUNT:6,.1f} bytes/employee, built in {elapsed:.1f}s)')
+    del roster
+
+  measure('objects with __dict__', lambda: [DictEmployee(*args[:2], **fields) for _, args, fields in make_rows()])
+  measure('objects with __slots__', lambda: [employee_type(*args) for employee_type, args, _ in make_rows()])
+
+  def build_table():
+    table = EmployeeTable()
+    for employee_type, args, _ in make_rows():
+      table.add_employee(employee_type(*args))
+    return table
+
+  measure('EmployeeTable', build_table)
+
+# ---------------------------------------------------------
@@ -7,6 +7,8 @@ from employee import Employee
 # Class(s)
 # ---------------------------------------------------------------------------------------------------------------------
 class HourlyEmployee(Employee):
+  __slots__ = ('hourly_rate', 'weekly_hours')
+
   def __init__(self, first_name, last_name, weekly_hours, hourly_rate):
     super().__init__(first_name, last_name)
     
@@ -0,0 +1,233 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import itertools
+import math
+import operator
+import time
+
+from array  import array
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from employee            import Employee
+from salary_employee     import SalaryEmployee
+from hourly_employee     import HourlyEmployee
+from commission_employee import CommissionEmployee
+
+try:
+  import numpy   # NOTE: pip install numpy, without it the same columns are computed with plain Python loops
+except ImportError:
+  numpy = None
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: one column group per concrete type and the numeric fields it needs. CommissionEmployee is a SalaryEmployee
+#       as well, so types are matched exactly (type(employee)), never with isinstance().
+COLUMNS = { SalaryEmployee    : ('salary',)
+           ,HourlyEmployee    : ('hourly_rate', 'weekly_hours')
+           ,CommissionEmployee: ('salary', 'sales_number', 'commission_rate') }
+
+WEEKS_PER_YEAR = 52
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def weekly_paychecks(employee_type: type, columns: Dict[str, array]):
+  """
+  Paychecks for one column group (a numpy array, or a list without numpy), in the same operation order as the
+  classes' calculate_weekly_paycheck() so the floating point results are bit for bit the same.
+  """
+  if numpy is not None:
+    c = {name: numpy.frombuffer(values, dtype=numpy.float64) for name, values in columns.items()}
+    if employee_type is SalaryEmployee:
+      return c['salary'] / WEEKS_PER_YEAR
+    if employee_type is HourlyEmployee:
+      return c['hourly_rate'] * c['weekly_hours']
+    return c['salary'] / WEEKS_PER_YEAR + c['sales_number'] * c['commission_rate']
+
+  if employee_type is SalaryEmployee:
+    return [salary / WEEKS_PER_YEAR for salary in columns['salary']]
+  if employee_type is HourlyEmployee:
+    return [rate * hours for rate, hours in zip(columns['hourly_rate'], columns['weekly_hours'])]
+  return [salary / WEEKS_PER_YEAR + sales * rate
+          for salary, sales, rate in zip(columns['salary'], columns['sales_number'], columns['commission_rate'])]
+
+# ---------------------------------------------------------
+def per_object_payroll(employees: Iterable[Employee]) -> 'PayrollResults':
+  """The original path: one virtual calculate_weekly_paycheck() call per employee. Kept as the reference."""
+  results = PayrollResults()
+  for employee in employees:
+    results.append(employee.first_name, employee.last_name, float(employee.calculate_weekly_paycheck()))
+  return results
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+class RunningTotal:
+  """
+  A sum of floats that can be added to and subtracted from without drifting: the exact value is kept as a short list
+  of non-overlapping partial sums (Shewchuk's algorithm, the same one math.fsum() uses), so removing an amount that
+  was added earlier cancels it exactly.
+  """
+  def __init__(self):
+    self.partials: List[float] = []
+
+  def add(self, amount: float) -> None:
+    i = 0
+    for partial in self.partials:
+      if abs(amount) < abs(partial):
+        amount, partial = partial, amount
+      high = amount + partial
+      low  = partial - (high - amount)
+      if low:
+        self.partials[i] = low
+        i += 1
+      amount = high
+    self.partials[i:] = [amount]
+
+  def value(self) -> float:
+    return math.fsum(self.partials)
+
+# ---------------------------------------------------------
+class PayrollResults:
+  """
+  Results table of a pay run, one row per employee in roster order: (first name, last name, amount).
+  """
+  def __init__(self):
+    self.first_names: List[str] = []
+    self.last_names: List[str]  = []
+    self.amounts = array('d')
+
+  def append(self, first_name: str, last_name: str, amount: float) -> None:
+    self.first_names.append(first_name)
+    self.last_names.append(last_name)
+    self.amounts.append(amount)
+
+  def __len__(self) -> int:
+    return len(self.amounts)
+
+  def __iter__(self) -> Iterator[Tuple[str, str, float]]:
+    return zip(self.first_names, self.last_names, self.amounts)
+
+  def __eq__(self, other) -> bool:
+    return (isinstance(other, PayrollResults) and self.first_names == other.first_names
+            and self.last_names == other.last_names and self.amounts == other.amounts)
+
+  def total(self) -> float:
+    return math.fsum(self.amounts)   # NOTE: exactly rounded, so the total does not depend on the order of the rows
+
+# ---------------------------------------------------------
+class PayrollEngine:
+  """
+  Columnar payroll: employees are grouped by type into float64 columns (array('d')) and each group's paychecks
+  are computed in one vectorized pass, instead of one method call per employee.
+  - employees of any other Employee subclass keep using their own calculate_weekly_paycheck()
+  - results come back in roster order, identical to per_object_payroll()
+  """
+  def __init__(self, employees: Iterable[Employee] = ()):
+    self.first_names: List[str] = []
+    self.last_names: List[str]  = []
+    self.groups: Dict[type, Dict[str, array]] = {employee_type: {name: array('d') for name in names}
+                                                 for employee_type, names in COLUMNS.items()}
+    self.positions: Dict[type, array] = {employee_type: array('q') for employee_type in COLUMNS}
+    self.others: List[Tuple[int, Employee]] = []
+
+    self.add_employees(employees)
+
+  # -------------------------------------------------------
+  def add_employee(self, employee: Employee) -> None:
+    position = len(self.first_names)
+    self.first_names.append(employee.first_name)
+    self.last_names.append(employee.last_name)
+
+    columns = self.groups.get(type(employee))
+    if columns is None:
+      self.others.append((position, employee))
+      return
+
+    for name, values in columns.items():
+      values.append(getattr(employee, name))
+    self.positions[type(employee)].append(position)
+
+  def add_employees(self, employees: Iterable[Employee]) -> None:
+    """
+    Bulk add_employee(): every column is filled with map()/itertools.compress() over the whole batch, so the loops
+    over the employees run in C instead of one Python level add_employee() call each.
+    """
+    employees = list(employees)
+    start     = len(self.first_names)
+    rows      = range(start, start + len(employees))
+    types     = list(map(type, employees))
+
+    self.first_names.extend(map(operator.attrgetter('first_name'), employees))
+    self.last_names.extend(map(operator.attrgetter('last_name'), employees))
+
+    for employee_type, columns in self.groups.items():
+      selected = list(map(operator.is_, types, itertools.repeat(employee_type)))
+      members  = list(itertools.compress(employees, selected))
+      if not members:
+        continue
+      # NOTE: array += array is a memory copy, array.extend(iterator) would append item by item
+      self.positions[employee_type] += array('q', list(itertools.compress(rows, selected)))
+      for name, values in columns.items():
+        values += array('d', list(map(operator.attrgetter(name), members)))
+
+    unknown = list(map(operator.not_, map(self.groups.__contains__, types)))
+    self.others.extend(itertools.compress(zip(rows, employees), unknown))
+
+  # -------------------------------------------------------
+  def run(self) -> PayrollResults:
+    amounts = array('d', bytes(8 * len(self.first_names)))
+
+    for employee_type, columns in self.groups.items():
+      positions = self.positions[employee_type]
+      paychecks = weekly_paychecks(employee_type, columns)
+      if numpy is not None:
+        # NOTE: scatter straight into 'amounts' through a writable view of its buffer
+        numpy.frombuffer(amounts, dtype=numpy.float64)[numpy.frombuffer(positions, dtype=numpy.int64)] = paychecks
+      else:
+        for position, amount in zip(positions, paychecks):
+          amounts[position] = amount
+
+    for position, employee in self.others:
+      amounts[position] = employee.calculate_weekly_paycheck()
+
+    results             = PayrollResults()
+    results.first_names = list(self.first_names)
+    results.last_names  = list(self.last_names)
+    results.amounts     = amounts
+    return results
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+  EMPLOYEE_COUNT = 500_000
+
+  employees: List[Employee] = []
+  for i in range(EMPLOYEE_COUNT):
+    if i % 3 == 0:
+      employees.append(SalaryEmployee('First', f'Last{i}', 40000 + i % 5000))
+    elif i % 3 == 1:
+      employees.append(HourlyEmployee('First', f'Last{i}', 20 + i % 30, 15 + i % 40))
+    else:
+      employees.append(CommissionEmployee('First', f'Last{i}', 30000 + i % 5000, i % 50, 100 + i % 150))
+
+  start     = time.perf_counter()
+  reference = per_object_payroll(employees)
+  print(f'per object : {time.perf_counter() - start:.3f}s')
+
+  # NOTE: the columns are built from the employee objects on every pay run (see Company.pay_employees()), so the build
+  #       is timed together with run()
+  start  = time.perf_counter()
+  engine = PayrollEngine(employees)
+  built  = time.perf_counter()
+  result = engine.run()
+  done   = time.perf_counter()
+  print(f'columnar   : {done - start:.3f}s ({built - start:.3f}s build + {done - built:.3f}s run, '
+        f'{"numpy" if numpy else "no numpy, plain loops"})')
+
+  print(f'identical  : {result == reference}  (total ${result.total():,.2f} for {len(result):,} employees)')
+
+# ---------------------------------------------------------
@@ -0,0 +1,257 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import csv
+import itertools
+import json
+import os
+import time
+
+from dataclasses import dataclass
+from typing      import Dict, Iterator, List, Optional, Tuple
+
+from employee            import Employee
+from salary_employee     import SalaryEmployee
+from hourly_employee     import HourlyEmployee
+from commission_employee import CommissionEmployee
+from payroll_engine      import PayrollEngine, PayrollResults, RunningTotal
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: Roster files are CSV (with a header row) or JSON Lines, one employee per row/line, with the fields:
+#         type, employee_id (optional), first_name, last_name, then the type's own fields below
+#       e.g. salary,1,Sarah,Hess,50000,,,,
+#            {"type": "hourly", "first_name": "Lee", "last_name": "Smith", "weekly_hours": 25, "hourly_rate": 50}
+EMPLOYEE_TYPES = { 'salary'    : (SalaryEmployee,     ('salary',))
+                  ,'hourly'    : (HourlyEmployee,     ('weekly_hours', 'hourly_rate'))
+                  ,'commission': (CommissionEmployee, ('salary', 'sales_number', 'commission_rate')) }
+
+ROSTER_FIELDS   = ('type', 'employee_id', 'first_name', 'last_name',
+                   'salary', 'weekly_hours', 'hourly_rate', 'sales_number', 'commission_rate')
+PAYCHECK_FIELDS = ('employee_id', 'first_name', 'last_name', 'amount')
+
+DEFAULT_CHUNK_SIZE = 10_000   # NOTE: rows held in memory at a time, whatever the size of the file
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def file_format(path: str) -> str:
+  extension = os.path.splitext(path)[1].lower()
+  if extension == '.csv':
+    return 'csv'
+  if extension in ('.jsonl', '.ndjson'):
+    return 'jsonl'
+  raise ValueError(f"'{path}' is neither a .csv nor a .jsonl file")
+
+# ---------------------------------------------------------
+def to_number(value):
+  """CSV fields are text: '50000' -> 50000 and '15.5' -> 15.5, so paychecks match hand built employees exactly."""
+  if not isinstance(value, str):
+    return value
+  try:
+    return int(value)
+  except ValueError:
+    return float(value)
+
+# ---------------------------------------------------------
+def employee_from_row(row: Dict[str, object], location: str) -> Employee:
+  try:
+    employee_type, fields = EMPLOYEE_TYPES[str(row['type']).strip().lower()]
+    employee = employee_type(row['first_name'], row['last_name'], *(to_number(row[name]) for name in fields))
+  except (KeyError, ValueError, TypeError) as error:
+    raise ValueError(f'{location}: cannot build an employee from {row!r} ({error!r})') from None
+
+  if row.get('employee_id') not in (None, ''):
+    employee.employee_id = int(row['employee_id'])
+  return employee
+
+# ---------------------------------------------------------
+def read_header(path: str) -> Tuple[Optional[List[str]], int]:
+  """Returns (CSV column names, byte position of the first row). JSONL files have no header: (None, 0)."""
+  if file_format(path) != 'csv':
+    return None, 0
+
+  with open(path, 'rb') as file:
+    header = file.readline()
+  return next(csv.reader([header.decode('utf-8-sig')])), len(header)
+
+# ---------------------------------------------------------
+def _iter_lines(path: str, start: int, end: Optional[int]) -> Iterator[str]:
+  """Lines starting in [start, end) bytes of the file, 'start' must be the start of a line."""
+  with open(path, 'rb') as file:
+    file.seek(start)
+    position = start
+    for line in file:
+      if end is not None and position >= end:
+        break
+      position += len(line)
+      yield line.decode('utf-8')
+
+# ---------------------------------------------------------
+def line_ranges(path: str, count: int) -> List[Tuple[int, int]]:
+  """
+  Splits the rows of a roster file into (up to) 'count' byte ranges of about the same size, each one starting and
+  ending on a line boundary, so every range can be read on its own (see read_employees()).
+  NOTE: assumes no CSV field contains a line break, which RosterWriter never writes
+  """
+  _, first_row = read_header(path)
+  size   = os.path.getsize(path)
+  bounds = [first_row]
+
+  with open(path, 'rb') as file:
+    for i in range(1, count):
+      file.seek(max(first_row + (size - first_row) * i // count - 1, bounds[-1]))
+      file.readline()   # NOTE: finish the line the split point fell into
+      bounds.append(min(file.tell(), size))
+  bounds.append(size)
+
+  return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+# ---------------------------------------------------------
+def iter_rows(path: str, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Dict[str, object]]:
+  fieldnames, first_row = read_header(path)
+  lines = _iter_lines(path, first_row if start is None else max(start, first_row), end)
+
+  if fieldnames is not None:
+    yield from csv.DictReader(lines, fieldnames=fieldnames)
+  else:
+    for line in lines:
+      if line.strip():
+        yield json.loads(line)
+
+# ---------------------------------------------------------
+def read_employees(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   start: Optional[int] = None, end: Optional[int] = None) -> Iterator[List[Employee]]:
+  """Streams a roster file (or the byte range start-end of it) as lists of at most chunk_size employees."""
+  if start is None:
+    first_line = 2 if file_format(path) == 'csv' else 1
+    locations  = (f'line {number}' for number in itertools.count(first_line))
+  else:
+    locations  = (f'row {number} of bytes {start}-{end}' for number in itertools.count(1))
+
+  chunk: List[Employee] = []
+  for location, row in zip(locations, iter_rows(path, start, end)):
+    chunk.append(employee_from_row(row, location))
+    if len(chunk) >= chunk_size:
+      yield chunk
+      chunk = []
+
+  if chunk:
+    yield chunk
+
+# ---------------------------------------------------------
+def stream_payroll(roster_path: str, paycheck_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> 'StreamResult':
+  """
+  Pay run from file to file: each chunk of the roster goes through the payroll engine and is written out before the
+  next one is read, so memory use depends on chunk_size only.
+  """
+  start = time.perf_counter()
+  rows, total = pay_rows(roster_path, paycheck_path, chunk_size)
+  return StreamResult(rows=rows, seconds=time.perf_counter() - start, total=total.value())
+
+# ---------------------------------------------------------
+def pay_rows(roster_path: str, paycheck_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+             start: Optional[int] = None, end: Optional[int] = None, header: bool = True) -> Tuple[int, RunningTotal]:
+  """The pay run loop behind stream_payroll(): returns (rows paid, exact running total of the amounts)."""
+  rows  = 0
+  total = RunningTotal()
+
+  with PaycheckWriter(paycheck_path, header) as writer:
+    for employees in read_employees(roster_path, chunk_size, start, end):
+      results = PayrollEngine(employees).run()
+      writer.write(employees, results)
+      rows += len(results)
+      for amount in results.amounts:
+        total.add(amount)
+
+  return rows, total
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+@dataclass
+class StreamResult:
+  rows: int
+  seconds: float
+  total: float = 0.0
+
+  @property
+  def rows_per_second(self) -> float:
+    return self.rows / self.seconds if self.seconds > 0 else float(self.rows)
+
+# ---------------------------------------------------------
+class RosterWriter:
+  """Writes employees to a CSV/JSONL roster file, the format read_employees() reads back."""
+  def __init__(self, path: str):
+    self.format = file_format(path)
+    self._file  = open(path, 'w', newline='', encoding='utf-8')
+    self._csv   = None
+    if self.format == 'csv':
+      self._csv = csv.writer(self._file)
+      self._csv.writerow(ROSTER_FIELDS)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self) -> None:
+    self._file.close()
+
+  def write(self, employee: Employee) -> None:
+    type_name = next(name for name, (employee_type, _) in EMPLOYEE_TYPES.items() if employee_type is type(employee))
+    row = { 'type'       : type_name
+           ,'employee_id': employee.employee_id
+           ,'first_name' : employee.first_name
+           ,'last_name'  : employee.last_name }
+    for name in EMPLOYEE_TYPES[type_name][1]:
+      row[name] = getattr(employee, name)
+
+    if self._csv:
+      self._csv.writerow(['' if row.get(name) is None else row[name] for name in ROSTER_FIELDS])
+    else:
+      self._file.write(json.dumps(row) + '\n')
+
+# ---------------------------------------------------------
+class PaycheckWriter:
+  """
+  Streams pay run results to CSV/JSONL: employee_id, first_name, last_name, amount.
+  - amounts are written with repr(), so reading the file back gives the exact same floats
+  - header = False leaves out the CSV header row (for parts that get concatenated later)
+  """
+  def __init__(self, path: str, header: bool = True):
+    self.format = file_format(path)
+    self._file  = open(path, 'w', newline='', encoding='utf-8')
+    self._csv   = None
+    if self.format == 'csv':
+      self._csv = csv.writer(self._file)
+      if header:
+        self._csv.writerow(PAYCHECK_FIELDS)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self) -> None:
+    self._file.close()
+
+  def write(self, employees: List[Employee], results: PayrollResults) -> None:
+    """'employees' are the ones 'results' were computed from, in the same order (it supplies the ids)."""
+    rows = zip(employees, results)
+    if self._csv:
+      self._csv.writerows([employee.employee_id, first_name, last_name, repr(amount)]
+                          for employee, (first_name, last_name, amount) in rows)
+    else:
+      self._file.writelines(json.dumps({ 'employee_id': employee.employee_id
+                                        ,'first_name' : first_name
+                                        ,'last_name'  : last_name
+                                        ,'amount'     : amount }) + '\n'
+                            for employee, (first_name, last_name, amount) in rows)
+
+# ---------------------------------------------------------
+
+# ---------------------------------------------------------
@@ -0,0 +1,95 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import argparse
+import filecmp
+import math
+import os
+import shutil
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from typing             import List, Tuple
+
+from payroll_io import (DEFAULT_CHUNK_SIZE, PAYCHECK_FIELDS, StreamResult,
+                        file_format, line_ranges, pay_rows, stream_payroll)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def part_path(paycheck_path: str, shard: int) -> str:
+  root, extension = os.path.splitext(paycheck_path)
+  return f'{root}.part{shard}{extension}'   # NOTE: keeps the extension, PaycheckWriter picks the format from it
+
+# ---------------------------------------------------------
+def pay_shard(roster_path: str, start: int, end: int, paycheck_path: str, chunk_size: int) -> Tuple[int, List[float]]:
+  """
+  Runs in a worker process: pays the rows in bytes start-end of the roster into its own part file and returns
+  (rows paid, exact partial sums of the amounts).
+  """
+  rows, total = pay_rows(roster_path, paycheck_path, chunk_size, start, end, header=False)
+  return rows, total.partials
+
+# ---------------------------------------------------------
+def parallel_stream_payroll(roster_path: str, paycheck_path: str, workers: int = os.cpu_count() or 1,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> StreamResult:
+  """
+  stream_payroll() across a process pool.
+  - the roster is sharded into contiguous byte ranges (so by row / employee id order), one per worker
+  - each shard is paid into its own part file, and the parts are joined in shard order, so the paycheck file is
+    byte for byte the one the serial run writes
+  - the total is merged from every shard's exact partial sums with math.fsum(), so it is exactly the serial total,
+    whatever the number of workers or the order the shards finish in
+  """
+  start  = time.perf_counter()
+  ranges = line_ranges(roster_path, workers)
+  parts  = [part_path(paycheck_path, shard) for shard in range(len(ranges))]
+
+  try:
+    with ProcessPoolExecutor(max_workers=max(1, len(ranges))) as pool:
+      futures = [pool.submit(pay_shard, roster_path, range_start, range_end, part, chunk_size)
+                 for (range_start, range_end), part in zip(ranges, parts)]
+      shards  = [future.result() for future in futures]
+
+    with open(paycheck_path, 'wb') as paychecks:
+      if file_format(paycheck_path) == 'csv':
+        # NOTE: the same header line csv.writer writes in the serial run
+        paychecks.write((','.join(PAYCHECK_FIELDS) + '\r\n').encode('utf-8'))
+      for part in parts:
+        with open(part, 'rb') as part_file:
+          shutil.copyfileobj(part_file, paychecks)
+  finally:
+    for part in parts:
+      if os.path.exists(part):
+        os.remove(part)
+
+  rows  = sum(shard_rows for shard_rows, _ in shards)
+  total = math.fsum(partial for _, partials in shards for partial in partials)
+  return StreamResult(rows=rows, seconds=time.perf_counter() - start, total=total)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Time the serial and sharded pay runs on a roster file and check '
+                                               'that they agree (see employee_company_main.py --generate).')
+  parser.add_argument('roster', help='roster file (.csv or .jsonl)')
+  parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+  arguments = parser.parse_args()
+
+  root, extension = os.path.splitext(arguments.roster)
+  serial_path     = f'{root}_paychecks_serial{extension}'
+  parallel_path   = f'{root}_paychecks_parallel{extension}'
+
+  serial = stream_payroll(arguments.roster, serial_path)
+  print(f'{"serial":>12}: {serial.seconds:6.2f}s  {serial.rows_per_second:10,.0f} rows/sec  total ${serial.total:,.2f}')
+
+  for workers in range(1, arguments.max_workers + 1):
+    result    = parallel_stream_payroll(arguments.roster, parallel_path, workers)
+    identical = result.total == serial.total and filecmp.cmp(serial_path, parallel_path, shallow=False)
+    print(f'{workers:2} worker(s): {result.seconds:6.2f}s  {result.rows_per_second:10,.0f} rows/sec  '
+          f'speedup {serial.seconds / result.seconds:4.2f}x  identical to serial: {identical}')
+
+  os.remove(parallel_path)
+
+# ---------------------------------------------------------
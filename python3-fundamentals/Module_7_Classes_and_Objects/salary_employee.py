@@ -7,6 +7,8 @@ from employee import Employee
 # Class(s)
 # ---------------------------------------------------------------------------------------------------------------------
 class SalaryEmployee(Employee):
+  __slots__ = ('salary',)
+
   def __init__(self, first_name, last_name, salary):
     super().__init__(first_name, last_name)
     self.salary = salary
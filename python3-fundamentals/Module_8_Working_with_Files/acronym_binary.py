@@ -0,0 +1,176 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import argparse
+import mmap
+import struct
+
+from typing import Iterator, List, Tuple
+
+from acronym_index import MODE_EXACT, MODE_PREFIX, MODE_SUBSTRING, ENTRY_SEPARATOR, parse_entry
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: Layout of a compact acronym file (all integers little-endian):
+#         header        : magic 'ACRB', version (uint32), entry count (uint32)
+#         offset array  : one uint64 per entry, pointing at its record, ordered by key
+#         string table  : one record per entry in the original file order: key length (uint16),
+#                         definition length (uint32), key bytes, definition bytes (UTF-8)
+#       Keeping the records in file order and only sorting the offsets means a round trip back to text keeps the
+#       original line order, while lookups can still binary search.
+BINARY_MAGIC   = b'ACRB'
+BINARY_VERSION = 1
+
+HEADER = struct.Struct('<4sII')
+OFFSET = struct.Struct('<Q')
+RECORD = struct.Struct('<HI')
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def text_to_binary(text_path: str, binary_path: str) -> int:
+  """Converts a 'KEY - Definition' text file to the compact format, returns the number of entries written."""
+  records: List[Tuple[bytes, bytes]] = []
+
+  with open(text_path, encoding='utf-8') as text:
+    for line in text:
+      entry = parse_entry(line)
+      if entry:
+        records.append((entry[0].encode('utf-8'), entry[1].encode('utf-8')))
+
+  table_start = HEADER.size + OFFSET.size * len(records)
+  positions: List[int] = []
+  position = table_start
+  for key, definition in records:
+    positions.append(position)
+    position += RECORD.size + len(key) + len(definition)
+
+  # NOTE: sorted() is stable, so duplicate keys keep their file order
+  ordered = sorted(range(len(records)), key=lambda i: records[i][0])
+
+  with open(binary_path, 'wb') as binary:
+    binary.write(HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(records)))
+    binary.write(b''.join(OFFSET.pack(positions[i]) for i in ordered))
+    for key, definition in records:
+      binary.write(RECORD.pack(len(key), len(definition)))
+      binary.write(key)
+      binary.write(definition)
+
+  return len(records)
+
+# ---------------------------------------------------------
+def binary_to_text(binary_path: str, text_path: str) -> int:
+  """Converts a compact file back to 'KEY - Definition' lines (original order), returns the number of entries."""
+  count = 0
+
+  with AcronymBinaryFile(binary_path) as acronyms, open(text_path, 'w', encoding='utf-8') as text:
+    for key, definition in acronyms.records():
+      text.write(key + ENTRY_SEPARATOR + definition + '\n')
+      count += 1
+
+  return count
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+class AcronymBinaryFile:
+  """
+  Read-only, memory-mapped view of a compact acronym file.
+  - opening it only reads the header, so startup does not depend on the file size
+  - exact/prefix lookups binary search the offset array directly in the mapping
+  """
+  def __init__(self, binary_path: str):
+    self.binary_path = binary_path
+    self._file       = open(binary_path, 'rb')
+    self._map        = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, self.count = HEADER.unpack_from(self._map, 0)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+      self.close()
+      raise ValueError(f"'{binary_path}' is not a version {BINARY_VERSION} compact acronym file")
+
+  # -------------------------------------------------------
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc_info):
+    self.close()
+
+  def close(self) -> None:
+    self._map.close()
+    self._file.close()
+
+  # -------------------------------------------------------
+  def _record_position(self, i: int) -> int:
+    return OFFSET.unpack_from(self._map, HEADER.size + OFFSET.size * i)[0]
+
+  def _key_at(self, position: int) -> bytes:
+    key_length, _ = RECORD.unpack_from(self._map, position)
+    start         = position + RECORD.size
+    return self._map[start:start + key_length]
+
+  def _entry_at(self, position: int) -> Tuple[str, str]:
+    key_length, definition_length = RECORD.unpack_from(self._map, position)
+    start = position + RECORD.size
+    key   = self._map[start:start + key_length]
+    definition = self._map[start + key_length:start + key_length + definition_length]
+    return key.decode('utf-8'), definition.decode('utf-8')
+
+  # -------------------------------------------------------
+  def _bisect_left(self, target: bytes) -> int:
+    low, high = 0, self.count
+    while low < high:
+      middle = (low + high) // 2
+      if self._key_at(self._record_position(middle)) < target:
+        low = middle + 1
+      else:
+        high = middle
+    return low
+
+  # -------------------------------------------------------
+  def records(self) -> Iterator[Tuple[str, str]]:
+    """Yields (key, definition) in the original file order."""
+    position = HEADER.size + OFFSET.size * self.count
+    for _ in range(self.count):
+      key_length, definition_length = RECORD.unpack_from(self._map, position)
+      yield self._entry_at(position)
+      position += RECORD.size + key_length + definition_length
+
+  # -------------------------------------------------------
+  def lookup(self, key: str, mode: str = MODE_EXACT) -> List[Tuple[str, str]]:
+    """Returns [(key, definition), ...] matching 'key', in key order."""
+    target = key.encode('utf-8')
+
+    if mode == MODE_SUBSTRING:
+      return [self._entry_at(position)
+              for position in map(self._record_position, range(self.count))
+              if target in self._key_at(position)]
+
+    results: List[Tuple[str, str]] = []
+    for i in range(self._bisect_left(target), self.count):
+      position  = self._record_position(i)
+      entry_key = self._key_at(position)
+      if entry_key == target or (mode == MODE_PREFIX and entry_key.startswith(target)):
+        results.append(self._entry_at(position))
+      else:
+        break
+
+    return results
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Main Program
+# ---------------------------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Convert acronym files between the text and compact binary formats.')
+  parser.add_argument('direction', choices=('to-binary', 'to-text'))
+  parser.add_argument('source')
+  parser.add_argument('destination')
+  arguments = parser.parse_args()
+
+  if arguments.direction == 'to-binary':
+    written = text_to_binary(arguments.source, arguments.destination)
+  else:
+    written = binary_to_text(arguments.source, arguments.destination)
+
+  print(f"Wrote {written:,} acronym(s) to '{arguments.destination}'")
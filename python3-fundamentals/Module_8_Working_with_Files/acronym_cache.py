@@ -0,0 +1,153 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import time
+
+from dataclasses import dataclass
+from typing      import Dict, Iterable, List, Optional, Tuple
+
+from acronym_index import ENTRY_SEPARATOR, parse_entry
+
+try:
+  import fcntl    # NOTE: POSIX advisory locks
+except ImportError:
+  fcntl = None
+  import msvcrt   # NOTE: Windows has no flock(), msvcrt.locking() is the closest equivalent
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def lock_file(file) -> None:
+  """Takes an exclusive advisory lock on an open file, blocking until it is available."""
+  if fcntl:
+    fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+  else:
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+# ---------------------------------------------------------
+def unlock_file(file) -> None:
+  if fcntl:
+    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+  else:
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+@dataclass
+class BulkAddResult:
+  added: int
+  skipped: int
+  seconds: float
+
+  @property
+  def entries_per_second(self) -> float:
+    return self.added / self.seconds if self.seconds > 0 else float(self.added)
+
+# ---------------------------------------------------------
+class AcronymCache:
+  """
+  Process-resident dictionary of the acronym file.
+  - loaded on first use and only reloaded when the file's mtime/size changes
+  - add() appends to the file and updates the dictionary together
+  """
+  def __init__(self, data_path: str):
+    self.data_path = data_path
+    self.entries: Dict[str, List[str]] = {}
+    self._signature: Optional[Tuple[int, int]] = None
+
+  # -------------------------------------------------------
+  def _current_signature(self) -> Tuple[int, int]:
+    stat = os.stat(self.data_path)
+    return stat.st_mtime_ns, stat.st_size
+
+  # -------------------------------------------------------
+  def _load(self, signature: Tuple[int, int]) -> None:
+    entries: Dict[str, List[str]] = {}
+
+    with open(self.data_path, encoding='utf-8') as file:
+      for line in file:
+        entry = parse_entry(line)
+        if entry:
+          entries.setdefault(entry[0], []).append(entry[1])
+
+    self.entries    = entries
+    self._signature = signature
+
+  # -------------------------------------------------------
+  def ensure_fresh(self) -> None:
+    """Reloads the dictionary if the file changed since it was loaded (one stat() per call)."""
+    signature = self._current_signature()
+    if signature != self._signature:
+      self._load(signature)
+
+  # -------------------------------------------------------
+  def get(self, key: str) -> List[str]:
+    """Returns every definition for 'key' (exact match), or an empty list."""
+    self.ensure_fresh()
+    return self.entries.get(key, [])
+
+  # -------------------------------------------------------
+  def add(self, key: str, definition: str) -> None:
+    key, definition = key.strip(), definition.strip()
+    line = (key + ENTRY_SEPARATOR + definition + '\n').encode('utf-8')
+    with open(self.data_path, 'ab') as file:    # NOTE: binary, so the byte count below is exact on every platform
+      self.ensure_fresh()                       # NOTE: after open(), which creates the file if it does not exist yet
+      file.write(line)
+
+    signature = self._current_signature()
+    if signature[1] != self._signature[1] + len(line):
+      self._load(signature)   # NOTE: someone else wrote to the file as well, fall back to a full reload
+      return
+
+    self.entries.setdefault(key, []).append(definition)
+    self._signature = signature
+
+  # -------------------------------------------------------
+  def add_many(self, entries: Iterable[Tuple[str, str]]) -> BulkAddResult:
+    """
+    Bulk append for imports.
+    - keys that already exist (in the file or earlier in 'entries') are skipped
+    - the whole batch is written with one write() under an exclusive file lock and fsync'd once
+    """
+    start   = time.perf_counter()
+    skipped = 0
+
+    with open(self.data_path, 'ab') as file:
+      lock_file(file)
+      try:
+        self.ensure_fresh()   # NOTE: re-check under the lock so keys added by other writers are seen
+
+        added: Dict[str, str] = {}
+        for key, definition in entries:
+          key, definition = key.strip(), definition.strip()
+          if not key or key in self.entries or key in added:
+            skipped += 1
+            continue
+          added[key] = definition
+
+        buffer = b''.join((key + ENTRY_SEPARATOR + definition + '\n').encode('utf-8')
+                          for key, definition in added.items())
+        if buffer:
+          file.write(buffer)
+          file.flush()
+          os.fsync(file.fileno())
+
+        signature = self._current_signature()
+        if signature[1] != self._signature[1] + len(buffer):
+          self._load(signature)
+        else:
+          for key, definition in added.items():
+            self.entries[key] = [definition]
+          self._signature = signature
+      finally:
+        unlock_file(file)
+
+    return BulkAddResult(added=len(added), skipped=skipped, seconds=time.perf_counter() - start)
+
+# ---------------------------------------------------------
+
+# ---------------------------------------------------------
@@ -0,0 +1,274 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import hashlib
+import heapq
+import os
+
+from typing import Iterator, List, Optional, Tuple
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: The index is a plain text file that sits next to the acronym file. The first line is a header that records
+#       how many bytes of the acronym file have been indexed and a fingerprint of those bytes, every other line is
+#       'KEY<TAB>OFFSET' sorted by key. The OFFSET is the byte position of the matching line in the acronym file, so a
+#       lookup only ever reads the lines it needs instead of the whole file.
+INDEX_MAGIC       = b'#acronym-index v2'
+ENTRY_SEPARATOR   = ' - '
+FINGERPRINT_BYTES = 4096   # NOTE: hashed from the start and the end of the indexed bytes, catches edits that move lines
+
+MODE_EXACT     = 'exact'
+MODE_PREFIX    = 'prefix'
+MODE_SUBSTRING = 'substring'
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def parse_entry(line: str) -> Optional[Tuple[str, str]]:
+  """Splits an 'KEY - Definition' line into (key, definition), or returns None for blank/malformed lines."""
+  key, separator, definition = line.strip().partition(ENTRY_SEPARATOR)
+  if not separator or not key.strip():
+    return None
+
+  return key.strip(), definition.strip()
+
+# ---------------------------------------------------------
+def parse_query(query: str) -> Tuple[str, str]:
+  """
+  Turns a user query into (key, mode).
+  - 'OOP'   -> exact match
+  - 'OO*'   -> prefix match
+  - '*OO*'  -> substring match (keys only)
+  """
+  query = query.strip()
+
+  if len(query) > 1 and query.startswith('*') and query.endswith('*'):
+    return query[1:-1], MODE_SUBSTRING
+  if len(query) > 1 and query.endswith('*'):
+    return query[:-1], MODE_PREFIX
+
+  return query, MODE_EXACT
+
+# ---------------------------------------------------------
+def _scan_entries(file, start: int) -> Tuple[List[Tuple[bytes, int]], int]:
+  """Reads complete lines from 'start' and returns ([(key, offset), ...], bytes covered)."""
+  entries: List[Tuple[bytes, int]] = []
+  covered = start
+
+  file.seek(start)
+  while True:
+    offset = file.tell()
+    line   = file.readline()
+    if not line.endswith(b'\n'):
+      break   # NOTE: EOF, or a partial last line that will be picked up once it gets its newline
+
+    covered = file.tell()
+    entry   = parse_entry(line.decode('utf-8', errors='replace'))
+    if entry:
+      entries.append((entry[0].encode('utf-8'), offset))
+
+  return entries, covered
+
+# ---------------------------------------------------------
+def file_fingerprint(file, covered: int) -> str:
+  """Hash of the first and last FINGERPRINT_BYTES of the first 'covered' bytes of the file."""
+  digest = hashlib.blake2b(digest_size=8)
+
+  file.seek(0)
+  digest.update(file.read(min(covered, FINGERPRINT_BYTES)))
+  if covered > FINGERPRINT_BYTES:
+    tail_start = max(FINGERPRINT_BYTES, covered - FINGERPRINT_BYTES)
+    file.seek(tail_start)
+    digest.update(file.read(covered - tail_start))
+
+  return digest.hexdigest()
+
+# ---------------------------------------------------------
+def _matches(entry_key: str, key: str, mode: str) -> bool:
+  if mode == MODE_SUBSTRING:
+    return key in entry_key
+  if mode == MODE_PREFIX:
+    return entry_key.startswith(key)
+  return entry_key == key
+
+# ---------------------------------------------------------
+def _split_index_line(line: bytes) -> Tuple[bytes, int]:
+  key, offset = line.rstrip(b'\n').rsplit(b'\t', 1)
+  return key, int(offset)
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+class AcronymIndex:
+  """
+  Sorted on-disk key index for the acronym file.
+  - exact and prefix lookups binary search the index file, O(log n) seeks
+  - substring lookups scan the (keys only) index file, never the acronym file
+  - refresh() only parses lines appended since the last build and merges them in, any other change to the file
+    (detected from the fingerprint in the header) rebuilds the index
+  """
+  def __init__(self, data_path: str, index_path: Optional[str] = None):
+    self.data_path  = data_path
+    self.index_path = index_path or os.path.splitext(data_path)[0] + '.idx'
+
+  # -------------------------------------------------------
+  def _read_header(self) -> Tuple[int, int, str]:
+    """
+    Returns (indexed bytes of the data file, byte position of the first index entry, fingerprint of the indexed
+    bytes), or (-1, 0, '') if missing.
+    """
+    try:
+      with open(self.index_path, 'rb') as index:
+        header = index.readline()
+        parts  = header.split()
+        if not header.startswith(INDEX_MAGIC) or len(parts) != 4:
+          return -1, 0, ''
+        return int(parts[2]), len(header), parts[3].decode('ascii')
+    except (FileNotFoundError, ValueError):
+      return -1, 0, ''
+
+  # -------------------------------------------------------
+  def _write_index(self, entries, covered: int, fingerprint: str) -> None:
+    temp_path = self.index_path + '.tmp'
+
+    with open(temp_path, 'wb') as index:
+      index.write(INDEX_MAGIC + b' ' + str(covered).encode('ascii') + b' ' + fingerprint.encode('ascii') + b'\n')
+      for key, offset in entries:
+        index.write(key + b'\t' + str(offset).encode('ascii') + b'\n')
+
+    os.replace(temp_path, self.index_path)   # NOTE: atomic swap, readers never see a half written index
+
+  # -------------------------------------------------------
+  def _existing_entries(self, start: int) -> Iterator[Tuple[bytes, int]]:
+    with open(self.index_path, 'rb') as index:
+      index.seek(start)
+      for line in index:
+        yield _split_index_line(line)
+
+  # -------------------------------------------------------
+  def rebuild(self) -> None:
+    """Builds the whole index from scratch."""
+    with open(self.data_path, 'rb') as data:
+      entries, covered = _scan_entries(data, 0)
+      fingerprint      = file_fingerprint(data, covered)
+
+    entries.sort()
+    self._write_index(entries, covered, fingerprint)
+
+  # -------------------------------------------------------
+  def refresh(self) -> None:
+    """Brings the index up to date, indexing only the lines appended since the last refresh."""
+    data_size                           = os.path.getsize(self.data_path)
+    covered, entries_start, fingerprint = self._read_header()
+
+    if covered < 0 or data_size < covered:
+      self.rebuild()    # NOTE: no index yet, or the acronym file was truncated
+      return
+
+    with open(self.data_path, 'rb') as data:
+      if file_fingerprint(data, covered) != fingerprint:
+        self.rebuild()  # NOTE: the indexed bytes were edited in place, the stored offsets cannot be trusted
+        return
+
+      if data_size == covered:
+        return
+
+      new_entries, new_covered = _scan_entries(data, covered)
+      if new_covered == covered:
+        return
+      new_fingerprint = file_fingerprint(data, new_covered)
+
+    new_entries.sort()
+    merged = heapq.merge(self._existing_entries(entries_start), new_entries)
+    self._write_index(merged, new_covered, new_fingerprint)
+
+  # -------------------------------------------------------
+  def _bisect_left(self, index, target: bytes, start: int, end: int) -> int:
+    """Returns the byte position of the first index line whose key is >= target."""
+    def line_start(position: int) -> int:
+      if position <= start:
+        return start
+      index.seek(position - 1)
+      index.readline()
+      return index.tell()
+
+    low, high = start, end
+    while low < high:
+      middle = (low + high) // 2
+      begin  = line_start(middle)
+      if begin >= end:
+        high = middle
+        continue
+
+      index.seek(begin)
+      key, _ = _split_index_line(index.readline())
+      if key < target:
+        low = middle + 1
+      else:
+        high = middle
+
+    return line_start(low)
+
+  # -------------------------------------------------------
+  def _matching_offsets(self, key: str, mode: str) -> List[int]:
+    target = key.encode('utf-8')
+    offsets: List[int] = []
+
+    _, start, _ = self._read_header()
+    end      = os.path.getsize(self.index_path)
+
+    with open(self.index_path, 'rb') as index:
+      if mode == MODE_SUBSTRING:
+        index.seek(start)
+        for line in index:
+          entry_key, offset = _split_index_line(line)
+          if target in entry_key:
+            offsets.append(offset)
+        return offsets
+
+      index.seek(self._bisect_left(index, target, start, end))
+      for line in index:
+        entry_key, offset = _split_index_line(line)
+        if entry_key == target or (mode == MODE_PREFIX and entry_key.startswith(target)):
+          offsets.append(offset)
+        else:
+          break
+
+    return offsets
+
+  # -------------------------------------------------------
+  def lookup(self, key: str, mode: str = MODE_EXACT) -> List[Tuple[str, str]]:
+    """Returns [(key, definition), ...] matching 'key', in key order."""
+    self.refresh()
+
+    results, stale = self._read_matches(key, mode)
+    if stale:
+      self.rebuild()    # NOTE: an offset pointed at some other line, the fingerprint missed an edit in the middle
+      results, _ = self._read_matches(key, mode)
+
+    return results
+
+  # -------------------------------------------------------
+  def _read_matches(self, key: str, mode: str) -> Tuple[List[Tuple[str, str]], bool]:
+    """Returns ([(key, definition), ...], whether any offset led to a line that does not match the query)."""
+    results: List[Tuple[str, str]] = []
+    stale   = False
+    offsets = self._matching_offsets(key, mode)
+    if not offsets:
+      return results, stale
+
+    with open(self.data_path, 'rb') as data:
+      for offset in offsets:
+        data.seek(offset)
+        entry = parse_entry(data.readline().decode('utf-8', errors='replace'))
+        if entry and _matches(entry[0], key, mode):
+          results.append(entry)
+        else:
+          stale = True
+
+    return results, stale
+
+# ---------------------------------------------------------
+
+# ---------------------------------------------------------
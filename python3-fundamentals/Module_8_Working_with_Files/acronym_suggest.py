@@ -0,0 +1,271 @@
+# ---------------------------------------------------------------------------------------------------------------------
+# import(s)
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import sqlite3
+
+from array       import array
+from collections import Counter
+from typing      import Dict, Iterable, List, Optional, Tuple
+
+from acronym_index import file_fingerprint, parse_entry
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Global Variable(s)
+# ---------------------------------------------------------------------------------------------------------------------
+# NOTE: The trigram index is a small sqlite database next to the acronym file, queried in place (nothing is loaded up
+#       front). Terms are the distinct lower-cased keys and definition words, each with the byte offsets of the lines
+#       it appears on, and every trigram maps to the terms containing it. Both lists are packed arrays (int64 offsets,
+#       int32 term ids), so appending lines to the acronym file only appends to the rows of the terms/trigrams they
+#       contain.
+TRIGRAM_INDEX_VERSION = 2
+MAX_CANDIDATES        = 200     # NOTE: only the terms sharing the most trigrams get the (expensive) edit distance
+MIN_SIMILARITY        = 0.5     # NOTE: 1 - distance / longest length, anything below is not worth suggesting
+MAX_LINES_PER_TERM    = 1000    # NOTE: a very common word only puts its first lines forward
+WORD_PUNCTUATION      = '.,;:!?()[]{}"\''
+
+SCHEMA = '''
+  CREATE TABLE IF NOT EXISTS meta  (name TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+  CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, text TEXT UNIQUE, offsets BLOB);
+  CREATE TABLE IF NOT EXISTS grams (gram TEXT PRIMARY KEY, terms BLOB) WITHOUT ROWID;
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Function(s)
+# ---------------------------------------------------------------------------------------------------------------------
+def trigrams(text: str) -> set:
+  """Lower-cased trigrams, padded so 1-2 character acronyms still produce some."""
+  padded = '  ' + text.lower() + ' '
+  return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# ---------------------------------------------------------
+def edit_distance(a: str, b: str) -> int:
+  """Levenshtein distance, two rows at a time."""
+  if len(a) < len(b):
+    a, b = b, a
+
+  previous = list(range(len(b) + 1))
+  for i, char_a in enumerate(a, 1):
+    current = [i]
+    for j, char_b in enumerate(b, 1):
+      current.append(min( previous[j] + 1
+                         ,current[j - 1] + 1
+                         ,previous[j - 1] + (char_a != char_b) ))
+    previous = current
+
+  return previous[-1]
+
+# ---------------------------------------------------------
+def similarity(a: str, b: str) -> float:
+  return 1 - edit_distance(a, b) / max(len(a), len(b), 1)
+
+# ---------------------------------------------------------
+def words(text: str) -> List[str]:
+  """Lower-cased words of a definition (or query), without the punctuation around them."""
+  return [word for word in (part.strip(WORD_PUNCTUATION) for part in text.lower().split()) if word]
+
+# ---------------------------------------------------------
+def entry_terms(key: str, definition: str) -> set:
+  return {key.lower(), *words(definition)}
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Class(s)
+# ---------------------------------------------------------------------------------------------------------------------
+class AcronymSuggester:
+  """
+  'Did you mean' suggestions from a trigram index stored next to the acronym file.
+  - keys and the individual words of definitions are indexed, case-insensitively
+  - a query is matched word by word, so 'memry' finds definitions containing 'Memory' and 'random acess memry'
+    ranks 'Random Access Memory' first
+  - lines appended to the acronym file are added to the index, any other change (size shrank, or the fingerprint of
+    the indexed bytes changed) rebuilds it
+  """
+  def __init__(self, data_path: str, index_path: Optional[str] = None):
+    self.data_path  = data_path
+    self.index_path = index_path or os.path.splitext(data_path)[0] + '.tri'
+
+    self._connection: Optional[sqlite3.Connection] = None
+
+  # -------------------------------------------------------
+  def _connect(self) -> sqlite3.Connection:
+    if self._connection is not None:
+      return self._connection
+
+    try:
+      connection = sqlite3.connect(self.index_path)
+      connection.executescript(SCHEMA)
+    except sqlite3.DatabaseError:
+      connection.close()
+      os.remove(self.index_path)   # NOTE: not a database, e.g. the JSON index older versions wrote
+      connection = sqlite3.connect(self.index_path)
+      connection.executescript(SCHEMA)
+
+    self._connection = connection
+    return connection
+
+  def close(self) -> None:
+    if self._connection is not None:
+      self._connection.close()
+      self._connection = None
+
+  # -------------------------------------------------------
+  def _meta(self) -> Dict[str, str]:
+    return dict(self._connect().execute('SELECT name, value FROM meta'))
+
+  # -------------------------------------------------------
+  def _scan(self, data, start: int) -> Tuple[Dict[str, List[int]], int]:
+    """Reads complete lines from 'start' and returns ({term: offsets of the lines it is on}, bytes covered)."""
+    offsets: Dict[str, List[int]] = {}
+    covered = start
+
+    data.seek(start)
+    while True:
+      offset = data.tell()
+      line   = data.readline()
+      if not line.endswith(b'\n'):
+        break   # NOTE: EOF, or a partial last line that will be picked up once it gets its newline
+
+      covered = data.tell()
+      entry   = parse_entry(line.decode('utf-8', errors='replace'))
+      if entry:
+        for term in entry_terms(*entry):
+          offsets.setdefault(term, []).append(offset)
+
+    return offsets, covered
+
+  # -------------------------------------------------------
+  def _extend(self, offsets: Dict[str, List[int]], covered: int, fingerprint: str, empty: bool = False) -> None:
+    """
+    Appends the terms of newly indexed lines, in one transaction with the new covered size/fingerprint.
+    NOTE: blobs are concatenated here rather than with SQL '||', which turns them into text
+    """
+    connection = self._connect()
+    new_terms: List[Tuple[int, str, bytes]] = []
+    new_grams: Dict[str, List[int]] = {}
+    next_id    = connection.execute('SELECT COALESCE(MAX(id), 0) + 1 FROM terms').fetchone()[0]
+
+    with connection:
+      for term, term_offsets in offsets.items():
+        packed = array('q', term_offsets).tobytes()
+        row    = None if empty else connection.execute('SELECT id, offsets FROM terms WHERE text = ?',
+                                                           (term,)).fetchone()
+        if row:
+          connection.execute('UPDATE terms SET offsets = ? WHERE id = ?', (row[1] + packed, row[0]))
+          continue
+
+        new_terms.append((next_id, term, packed))
+        for gram in trigrams(term):
+          new_grams.setdefault(gram, []).append(next_id)
+        next_id += 1
+
+      connection.executemany('INSERT INTO terms (id, text, offsets) VALUES (?, ?, ?)', new_terms)
+      for gram, term_ids in new_grams.items():
+        row = None if empty else connection.execute('SELECT terms FROM grams WHERE gram = ?', (gram,)).fetchone()
+        connection.execute('INSERT OR REPLACE INTO grams (gram, terms) VALUES (?, ?)',
+                           (gram, (row[0] if row else b'') + array('i', term_ids).tobytes()))
+      connection.executemany('INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)',
+                             ( ('version', str(TRIGRAM_INDEX_VERSION))
+                              ,('covered', str(covered))
+                              ,('fingerprint', fingerprint) ))
+
+  # -------------------------------------------------------
+  def rebuild(self) -> None:
+    connection = self._connect()
+    with connection:
+      connection.execute('DELETE FROM meta')
+      connection.execute('DELETE FROM terms')
+      connection.execute('DELETE FROM grams')
+
+    with open(self.data_path, 'rb') as data:
+      offsets, covered = self._scan(data, 0)
+      fingerprint      = file_fingerprint(data, covered)
+    self._extend(offsets, covered, fingerprint, empty=True)
+
+  # -------------------------------------------------------
+  def ensure_fresh(self) -> None:
+    data_size = os.path.getsize(self.data_path)
+    meta      = self._meta()
+
+    if meta.get('version') != str(TRIGRAM_INDEX_VERSION) or data_size < int(meta.get('covered', -1)):
+      self.rebuild()
+      return
+
+    covered = int(meta['covered'])
+    with open(self.data_path, 'rb') as data:
+      if file_fingerprint(data, covered) != meta['fingerprint']:
+        self.rebuild()  # NOTE: the indexed bytes were edited in place, the stored offsets cannot be trusted
+        return
+
+      if data_size == covered:
+        return
+
+      offsets, new_covered = self._scan(data, covered)
+      if new_covered == covered:
+        return
+      fingerprint = file_fingerprint(data, new_covered)
+
+    self._extend(offsets, new_covered, fingerprint)
+
+  # -------------------------------------------------------
+  def _candidates(self, query: str) -> List[Tuple[str, float, array]]:
+    """[(term, similarity to 'query', offsets), ...] for the indexed terms closest to one query word."""
+    connection = self._connect()
+    grams      = sorted(trigrams(query))
+    shared     = Counter()
+    for (term_ids,) in connection.execute(f'SELECT terms FROM grams WHERE gram IN ({",".join("?" * len(grams))})',
+                                          grams):
+      shared.update(array('i', term_ids))
+
+    candidates: List[Tuple[str, float, array]] = []
+    for term_id, _ in shared.most_common(MAX_CANDIDATES):
+      text, term_offsets = connection.execute('SELECT text, offsets FROM terms WHERE id = ?', (term_id,)).fetchone()
+      score = similarity(query, text)
+      if score >= MIN_SIMILARITY:
+        candidates.append((text, score, array('q', term_offsets)[:MAX_LINES_PER_TERM]))
+
+    return candidates
+
+  # -------------------------------------------------------
+  def _read_entries(self, offsets: Iterable[int]) -> Dict[int, Tuple[str, str]]:
+    entries: Dict[int, Tuple[str, str]] = {}
+    with open(self.data_path, 'rb') as data:
+      for offset in offsets:
+        data.seek(offset)
+        entry = parse_entry(data.readline().decode('utf-8', errors='replace'))
+        if entry:
+          entries[offset] = entry
+    return entries
+
+  # -------------------------------------------------------
+  def suggest(self, query: str, limit: int = 5) -> List[Tuple[str, str]]:
+    """Returns up to 'limit' (key, definition) pairs closest to 'query', best match first."""
+    self.ensure_fresh()
+
+    text = query.strip().lower()
+    if not text:
+      return []
+    query_words = words(text) or [text]
+
+    # NOTE: every line scores the average, over the query words, of its best matching term for that word
+    scores: Dict[int, float] = {}
+    for word in query_words:
+      best: Dict[int, float] = {}
+      for _, score, term_offsets in self._candidates(word):
+        for offset in term_offsets:
+          if score > best.get(offset, 0.0):
+            best[offset] = score
+      for offset, score in best.items():
+        scores[offset] = scores.get(offset, 0.0) + score / len(query_words)
+
+    # NOTE: then the whole query is compared with the key and the whole definition of the best lines
+    shortlist = sorted(scores, key=lambda offset: (-scores[offset], offset))[:limit * 10]
+    entries   = self._read_entries(shortlist)
+    ranked    = {offset: max(scores[offset], similarity(text, key.lower()), similarity(text, definition.lower()))
+                 for offset, (key, definition) in entries.items()}
+
+    best_first = sorted(ranked, key=lambda offset: (-ranked[offset], offset))
+    return [entries[offset] for offset in best_first[:limit] if ranked[offset] >= MIN_SIMILARITY]
+
+# ---------------------------------------------------------
+
+# ---------------------------------------------------------
@@ -1,7 +1,17 @@
 # ---------------------------------------------------------------------------------------------------------------------
 # import(s)
 # ---------------------------------------------------------------------------------------------------------------------
+import argparse
+import json
+import sys
+
 from pathlib import Path
+from typing  import List, Tuple
+
+from acronym_binary  import AcronymBinaryFile
+from acronym_cache   import AcronymCache
+from acronym_index   import AcronymIndex, MODE_EXACT, parse_entry, parse_query
+from acronym_suggest import AcronymSuggester
 
 # ---------------------------------------------------------------------------------------------------------------------
 # Global Variable(s)
@@ -10,12 +20,21 @@ current_directory = str(Path.cwd())
 current_module    = 'module_8_working_with_files'
 file_name         = 'software_acronyms.txt'
 file_path         = current_directory + '\\' + current_module + '\\' + file_name
+index_name        = 'software_acronyms.idx'
+index_path        = current_directory + '\\' + current_module + '\\' + index_name
+
+acronym_index     = AcronymIndex(file_path, index_path)
+acronym_cache     = AcronymCache(file_path)      # NOTE: exact lookups are served from memory, the index handles '*' queries
+acronym_suggester = AcronymSuggester(file_path)  # NOTE: 'did you mean' suggestions from a trigram index
+acronym_binary    = None                         # NOTE: set by '--binary', lookups then binary search the memory-mapped file
 
 YES_NO   = {'y': True, 'yes': True, 'n': False, 'no': False}
 FIND_ADD = {'F': 'F', 'A': 'A'}
 #FIND_ADD = [ (lambda v: v in ('F', 'f'), 'F')
 #            ,(lambda v: v in ('A', 'a'), 'A') ]
 
+BATCH_FORMATS = ('tsv', 'jsonl')
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Function(s)
 # ---------------------------------------------------------------------------------------------------------------------
@@ -62,28 +81,54 @@ def add_acronum() -> None:
   acronym    = input("What acronym would you like to add? ")
   definition = input("What is the acronym's definition? ")
 
-  with open(file_path, 'a') as file:
-    file.write(acronym + ' - ' + definition + '\n')
+  acronym_cache.add(acronym, definition)    # NOTE: writes the file and updates the in-memory copy together
+  acronym_index.refresh()   # NOTE: only indexes the line that was just appended
+
+  if acronym_binary:
+    print(f"NOTE: '{acronym_binary.binary_path}' is read-only, re-run acronym_binary.py to include the new acronym.")
 
 # ---------------------------------------------------------
+def lookup_acronym(key, mode) -> List[Tuple[str, str]]:
+  if acronym_binary:
+    return acronym_binary.lookup(key, mode)
+
+  if mode == MODE_EXACT:
+    return [(key, definition) for definition in acronym_cache.get(key)]
+
+  return acronym_index.lookup(key, mode)
+
+# ---------------------------------------------------------
+# NOTE: lookups go through the sorted key index (see acronym_index.py) instead of scanning every line of the file.
+#       'OOP' is an exact match, 'OO*' is a prefix match and '*OO*' matches any acronym containing 'OO'.
 def find_acronym() -> None:
-  found   = False
-  acronym = input("What software acronym would you like to look up? ")
+  acronym   = input("What software acronym would you like to look up? ")
+  key, mode = parse_query(acronym)
 
   try:
-    with open(file_path) as file:
-      for line in file:
-        if acronym in line:        
-          found = True
-          print(line)
-          break
+    matches = lookup_acronym(key, mode)
   except FileNotFoundError as ex:
     print(f"EXCEPTION: File '{file_name}' not found")
     return
 
-  if not found:
+  if not matches:
     print(f"The acronym you requested '{acronym}', does not exist.")
 
+    # NOTE: suggestions come from the text file, so they are left out when looking up in a '--binary' file
+    if acronym_binary:
+      return
+
+    try:
+      suggestions = acronym_suggester.suggest(key)
+    except FileNotFoundError:
+      return
+
+    if suggestions:
+      print('Did you mean: ' + ', '.join(f"{match_key} ({definition})" for match_key, definition in suggestions) + '?')
+    return
+
+  for match_key, definition in matches:
+    print(match_key + ' - ' + definition)
+
 # ---------------------------------------------------------
 def main():
   # ask the user whether they want to find or add an acronym
@@ -104,9 +149,113 @@ def main():
               ,choices = YES_NO
               ,normalize = lambda s: s.strip().lower())
 
+# ---------------------------------------------------------
+def format_matches(query, matches, output_format) -> str:
+  if output_format == 'jsonl':
+    return json.dumps({ 'query'  : query
+                       ,'matches': [{'acronym': key, 'definition': definition} for key, definition in matches] })
+
+  # NOTE: TSV is one row per match, a query without a match still gets a row (with empty acronym/definition)
+  rows = list(matches) or [('', '')]
+  return '\n'.join(query + '\t' + key + '\t' + definition for key, definition in rows)
+
+# ---------------------------------------------------------
+# NOTE: non-interactive mode, one query per line in, results streamed out as they are found, so memory does not
+#       grow with the number of queries. The acronym file is loaded once for the whole run.
+def batch_lookup(queries, output, output_format='tsv') -> int:
+  if not acronym_binary:
+    acronym_cache.ensure_fresh()
+  count = 0
+
+  for line in queries:
+    query = line.strip()
+    if not query:
+      continue
+
+    key, mode = parse_query(query)
+    if acronym_binary:
+      matches = acronym_binary.lookup(key, mode)
+    elif mode == MODE_EXACT:
+      matches = [(key, definition) for definition in acronym_cache.entries.get(key, [])]
+    else:
+      matches = acronym_index.lookup(key, mode)
+
+    output.write(format_matches(query, matches, output_format) + '\n')
+    count += 1
+
+  return count
+
+# ---------------------------------------------------------
+# NOTE: bulk import of a 'KEY - Definition' file, existing acronyms are skipped rather than added a second time.
+def import_acronyms(source) -> None:
+  entries = (entry for entry in (parse_entry(line) for line in source) if entry)
+  result  = acronym_cache.add_many(entries)
+  acronym_index.refresh()
+
+  print(f"Imported {result.added:,} acronym(s), skipped {result.skipped:,} duplicate(s) "
+        f"in {result.seconds:.3f}s ({result.entries_per_second:,.0f} entries/sec)")
+
+# ---------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+  parser = argparse.ArgumentParser(description='Look up or add software acronyms.')
+  parser.add_argument( '--batch'
+                      ,metavar = 'QUERIES'
+                      ,help    = "Answer every query in QUERIES (one per line, '-' for stdin) without prompting.")
+  parser.add_argument( '--format'
+                      ,choices = BATCH_FORMATS
+                      ,default = 'tsv'
+                      ,help    = 'Output format for --batch (default: tsv).')
+  parser.add_argument( '--import'
+                      ,dest    = 'import_file'
+                      ,metavar = 'ACRONYMS'
+                      ,help    = "Bulk add every 'KEY - Definition' line in ACRONYMS ('-' for stdin).")
+  parser.add_argument( '--file'
+                      ,help    = f"Acronym file to use (default: {file_name}).")
+  parser.add_argument( '--binary'
+                      ,metavar = 'ACRB'
+                      ,help    = 'Look acronyms up in a compact binary file (see acronym_binary.py) instead.')
+  return parser
+
 # ---------------------------------------------------------------------------------------------------------------------
 # Main Program
 # ---------------------------------------------------------------------------------------------------------------------
-while True:
-  if not main():
-    break
+arguments = build_parser().parse_args()
+
+if arguments.file:
+  file_name         = arguments.file    # NOTE: also what the 'not found' messages print
+  file_path         = arguments.file
+  acronym_index     = AcronymIndex(file_path)
+  acronym_cache     = AcronymCache(file_path)
+  acronym_suggester = AcronymSuggester(file_path)
+
+if arguments.binary:
+  try:
+    acronym_binary = AcronymBinaryFile(arguments.binary)
+  except (FileNotFoundError, ValueError) as ex:
+    print(f"EXCEPTION: {ex}", file=sys.stderr)
+    sys.exit(1)
+
+if arguments.import_file:
+  try:
+    if arguments.import_file == '-':
+      import_acronyms(sys.stdin)
+    else:
+      with open(arguments.import_file, encoding='utf-8') as source:
+        import_acronyms(source)
+  except FileNotFoundError as ex:
+    print(f"EXCEPTION: File '{ex.filename}' not found", file=sys.stderr)
+    sys.exit(1)
+elif arguments.batch:
+  try:
+    if arguments.batch == '-':
+      batch_lookup(sys.stdin, sys.stdout, arguments.format)
+    else:
+      with open(arguments.batch, encoding='utf-8') as queries:
+        batch_lookup(queries, sys.stdout, arguments.format)
+  except FileNotFoundError as ex:
+    print(f"EXCEPTION: File '{ex.filename}' not found", file=sys.stderr)
+    sys.exit(1)
+else:
+  while True:
+    if not main():
+      break
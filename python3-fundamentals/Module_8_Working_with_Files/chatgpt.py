@@ -15,18 +15,35 @@ Organize files in a target folder (default: your Desktop) into subfolders by fil
 - Dry-run mode to preview changes.
 - Undo capability using a move log saved alongside the target folder.
 - Optional zip extraction.
+- Summary output with a progress line by default; -v lists every file, --events writes JSON Lines.
 """
 from __future__ import annotations
 
 import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import itertools
 import json
+import os
+import re
+import select
 import shutil
+import signal
+import struct
 import sys
 import tarfile
+import tempfile
+import threading
+import time
+import uuid
 import zipfile
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 
 # -------------------- Configuration --------------------
 
@@ -37,7 +54,7 @@ CATEGORY_MAP: Dict[str, Iterable[str]] = {
     "PDFs": (".pdf",),
     "Spreadsheets": (".xls", ".xlsx", ".xlsm", ".ods", ".csv", ".tsv"),
     "Presentations": (".ppt", ".pptx", ".key", ".odp"),
-    "Archives": (".zip", ".tar", ".gz", ".tgz", ".bz2", ".tbz2", ".xz", ".7z", ".rar"),
+    "Archives": (".zip", ".tar", ".tar.gz", ".tar.bz2", ".tar.xz", ".gz", ".tgz", ".bz2", ".tbz2", ".xz", ".7z", ".rar"),
     "Audio": (".mp3", ".wav", ".aac", ".flac", ".m4a", ".ogg", ".wma", ".aiff"),
     "Video": (".mp4", ".mov", ".mkv", ".avi", ".wmv", ".webm", ".m4v"),
     "Code": (".py", ".js", ".ts", ".tsx", ".jsx", ".java", ".c", ".cpp", ".cs", ".go", ".rb", ".php", ".rs", ".swift", ".kt", ".m", ".h", ".sql", ".json", ".yml", ".yaml", ".toml", ".ini", ".sh", ".bat", ".ps1"),
@@ -51,13 +68,244 @@ CATEGORY_MAP: Dict[str, Iterable[str]] = {
 }
 
 OTHER_CATEGORY = "Other"
-MOVE_LOG_NAME = ".organize_desktop_log.json"
+MOVE_LOG_NAME = ".organize_desktop_log.json"  # legacy whole-file JSON log, migrated into the journal
+JOURNAL_NAME = ".organize_desktop_journal.jsonl"
+RUN_INDEX_NAME = ".organize_desktop_runs.jsonl"  # run id -> byte range in the journal
+UNDO_ALL = "all"  # `--undo` without a run id
+COPY_CHUNK = 8 * 1024 * 1024  # bytes per copy_file_range/sendfile call on cross-device moves
+
+# Per-archive budgets for --extract-archives; an archive over either limit is not extracted.
+DEFAULT_MAX_EXTRACT_BYTES = 4 * 1024 ** 3
+DEFAULT_MAX_EXTRACT_ENTRIES = 100_000
+EXTRACT_CHUNK = 1024 * 1024
+
+# --dedupe: size first, then the first/last DEDUPE_EDGE_BYTES, then a full hash
+DEDUPE_MODES = ("report", "hardlink")
+DEDUPE_EDGE_BYTES = 64 * 1024
+DEDUPE_READ_BYTES = 1024 * 1024
+
+PLAN_VERSION = 1  # --plan/--apply file format
+APPLY_CHUNK = 10_000  # plan entries handed to the worker pool at a time
+
+# Output levels: -q shows only warnings/errors, the default adds per-stage
+# summaries and a progress line, -v lists every file.
+QUIET, NORMAL, VERBOSE = 0, 1, 2
+PROGRESS_INTERVAL = 0.2  # seconds between progress line redraws
+
+# --watch: a new file is handled once its size/mtime stayed the same for this long
+DEFAULT_WATCH_DEBOUNCE = 0.25
+DEFAULT_WATCH_POLL_INTERVAL = 1.0  # only used when inotify is unavailable
+SNIFF_CACHE_NAME = ".organize_desktop_sniff.json"
+SNAPSHOT_NAME = ".organize_desktop_snapshot.json"  # --recursive: state of the tree after the last run
+HASH_CACHE_NAME = ".organize_desktop_hashes.json"  # --dedupe: digests by (inode, mtime, size)
+
+# Files the organizer keeps in the target folder for itself; never organized.
+RESERVED_NAMES = {MOVE_LOG_NAME, JOURNAL_NAME, RUN_INDEX_NAME, SNIFF_CACHE_NAME, SNAPSHOT_NAME, HASH_CACHE_NAME}
+
+# Magic numbers for --sniff: (offset, signature, category). Checked in order, first match wins.
+SNIFF_BYTES = 512  # enough to reach the tar "ustar" marker at offset 257
+MAGIC_SIGNATURES: List[Tuple[int, bytes, str]] = [
+    (0, b"\x89PNG\r\n\x1a\n", "Images"),
+    (0, b"\xff\xd8\xff", "Images"),
+    (0, b"GIF87a", "Images"),
+    (0, b"GIF89a", "Images"),
+    (0, b"BM", "Images"),
+    (0, b"II*\x00", "Images"),
+    (0, b"MM\x00*", "Images"),
+    (8, b"WEBP", "Images"),
+    (0, b"%PDF-", "PDFs"),
+    (0, b"{\\rtf", "Documents"),
+    (0, b"PK\x03\x04", "Archives"),
+    (0, b"\x1f\x8b", "Archives"),
+    (0, b"BZh", "Archives"),
+    (0, b"\xfd7zXZ\x00", "Archives"),
+    (0, b"7z\xbc\xaf\x27\x1c", "Archives"),
+    (0, b"Rar!\x1a\x07", "Archives"),
+    (257, b"ustar", "Archives"),
+    (0, b"ID3", "Audio"),
+    (0, b"fLaC", "Audio"),
+    (0, b"OggS", "Audio"),
+    (8, b"WAVE", "Audio"),
+    (4, b"ftyp", "Video"),
+    (0, b"\x1a\x45\xdf\xa3", "Video"),
+    (8, b"AVI ", "Video"),
+    (0, b"wOFF", "Fonts"),
+    (0, b"wOF2", "Fonts"),
+    (0, b"OTTO", "Fonts"),
+    (0, b"PAR1", "Data"),
+    (0, b"MZ", "Executables"),
+    (0, b"\x7fELF", "Executables"),
+    (0, b"\xcf\xfa\xed\xfe", "Executables"),
+    (0, b"8BPS", "Design"),
+    (0, b"%!PS", "Design"),
+]
+
+# Suffixes that tarfile can open; the compound ones are also stripped whole when naming the extract folder.
+TAR_SUFFIXES = {".tar", ".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tbz2", ".gz", ".bz2", ".xz"}
+
+# Common screenshot name patterns (see detect_screenshot).
+SCREENSHOT_PATTERN = re.compile(r"screenshot|^(?:screen[ _]shot|snip|screencap)", re.IGNORECASE)
+
+
+def build_extension_map(category_map: Dict[str, Iterable[str]]) -> Dict[str, str]:
+    """Reverse CATEGORY_MAP into extension -> category (first category listing an extension wins)."""
+    extension_map: Dict[str, str] = {}
+    for cat, exts in category_map.items():
+        if cat == "Screenshots":
+            # pseudo extension, decided by filename instead
+            continue
+        for ext in exts:
+            extension_map.setdefault(ext, cat)
+    return extension_map
+
+
+EXTENSION_CATEGORY: Dict[str, str] = build_extension_map(CATEGORY_MAP)
 
 
 @dataclass
 class MoveRecord:
     src: str
     dst: str
+    run: str = ""
+
+
+@dataclass
+class RunInfo:
+    run: str
+    start: int
+    end: Optional[int] = None
+    count: int = 0
+    undone: bool = False
+
+
+def format_bytes(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} TB"
+
+
+class Progress:
+    """
+    Single-line progress (files/sec, bytes/sec, ETA), redrawn at most every
+    PROGRESS_INTERVAL seconds. bytes_done, if given, is polled at redraw time
+    (e.g. FileMover.bytes_moved) rather than passed per file.
+    """
+
+    def __init__(
+        self,
+        reporter: "Reporter",
+        label: str,
+        total: Optional[int] = None,
+        bytes_done: Optional[Callable[[], int]] = None,
+    ) -> None:
+        self.reporter = reporter
+        self.label = label
+        self.total = total
+        self.bytes_done = bytes_done
+        self.done = 0
+        self.started = time.monotonic()
+        self._next_draw = self.started + PROGRESS_INTERVAL
+
+    def advance(self, count: int = 1) -> None:
+        with self.reporter.lock:
+            self.done += count
+            now = time.monotonic()
+            if now >= self._next_draw:
+                self._next_draw = now + PROGRESS_INTERVAL
+                self.reporter.draw_progress(self.render(now))
+
+    def render(self, now: float) -> str:
+        elapsed = max(now - self.started, 1e-9)
+        rate = self.done / elapsed
+        parts = [f"{self.label}: {self.done:,}" + (f"/{self.total:,}" if self.total else "") + " file(s)"]
+        parts.append(f"{rate:,.0f} files/s")
+        if self.bytes_done is not None:
+            parts.append(f"{format_bytes(self.bytes_done() / elapsed)}/s")
+        if self.total and rate > 0:
+            remaining = int((self.total - self.done) / rate)
+            parts.append(f"ETA {remaining // 60}:{remaining % 60:02d}")
+        return "  ".join(parts)
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.reporter.clear_progress()
+
+
+class Reporter:
+    """
+    All user-facing output goes through here instead of print().
+
+    Messages carry a level and are shown only at or below the configured one,
+    so the default output of a large run is a few summary lines. Every message
+    is also an event: with an event stream configured, each one is written as
+    a JSON line ({"ts", "event", ...fields}) whether or not it is shown.
+    Safe to call from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self.level = NORMAL
+        self.out: TextIO = sys.stdout
+        self.events: Optional[TextIO] = None
+        self.lock = threading.RLock()
+        self._progress_shown = False
+
+    def configure(self, level: int = NORMAL, events_path: Optional[str] = None) -> None:
+        self.level = level
+        if events_path == "-":
+            self.events = sys.stdout
+            self.out = sys.stderr  # keep the event stream machine-readable
+        elif events_path:
+            self.events = open(events_path, "a", encoding="utf-8")
+
+    def close(self) -> None:
+        self.clear_progress()
+        if self.events is not None:
+            self.events.flush()
+            if self.events is not sys.stdout:
+                self.events.close()
+            self.events = None
+
+    def emit(self, event: str, message: Optional[str] = None, level: int = VERBOSE, **fields) -> None:
+        with self.lock:
+            if self.events is not None:
+                record = {"ts": round(time.time(), 6), "event": event, **fields}
+                if message:
+                    record["message"] = message
+                self.events.write(json.dumps(record) + "\n")
+            if message is not None and level <= self.level:
+                self.clear_progress()
+                print(message, file=self.out)
+
+    def info(self, message: str, event: str = "info", **fields) -> None:
+        self.emit(event, message, NORMAL, **fields)
+
+    def warning(self, message: str, event: str = "warning", **fields) -> None:
+        self.emit(event, message, QUIET, **fields)
+
+    def progress(
+        self, label: str, total: Optional[int] = None, bytes_done: Optional[Callable[[], int]] = None
+    ) -> Progress:
+        return Progress(self, label, total, bytes_done)
+
+    def draw_progress(self, line: str) -> None:
+        if self.level >= NORMAL and sys.stderr.isatty():
+            sys.stderr.write("\r\x1b[K" + line)
+            sys.stderr.flush()
+            self._progress_shown = True
+
+    def clear_progress(self) -> None:
+        with self.lock:
+            if self._progress_shown:
+                sys.stderr.write("\r\x1b[K")
+                sys.stderr.flush()
+                self._progress_shown = False
+
+
+report = Reporter()
 
 
 def default_desktop() -> Path:
@@ -67,18 +315,33 @@ def default_desktop() -> Path:
 
 def detect_screenshot(filename: str) -> bool:
     """Heuristic: common screenshot name patterns."""
+    return SCREENSHOT_PATTERN.search(filename) is not None
+
+
+def file_suffix(filename: str) -> str:
+    """Lower-cased suffix, keeping known compound suffixes such as .tar.gz together."""
     lower = filename.lower()
-    return (
-        "screenshot" in lower
-        or lower.startswith("screen shot")
-        or lower.startswith("screen_shot")
-        or lower.startswith("snip")
-        or lower.startswith("snipping")
-        or lower.startswith("screencap")
-    )
+    dot = lower.rfind(".")
+    if dot <= 0:
+        return ""
+    previous = lower.rfind(".", 0, dot)
+    if previous > 0 and lower[previous:] in EXTENSION_CATEGORY:
+        return lower[previous:]
+    return lower[dot:]
 
 
 def categorize(file: Path) -> str:
+    name = file.name
+    category = EXTENSION_CATEGORY.get(file_suffix(name), OTHER_CATEGORY)
+
+    # Special-case screenshots into "Screenshots" even if they're images
+    if category == "Images" and detect_screenshot(name):
+        return "Screenshots"
+    return category
+
+
+def categorize_linear(file: Path) -> str:
+    """The original per-call scan over CATEGORY_MAP, kept as the --benchmark-categorize baseline."""
     suffix = file.suffix.lower()
     name = file.name
 
@@ -95,12 +358,259 @@ def categorize(file: Path) -> str:
     return OTHER_CATEGORY
 
 
+class ContentSniffer:
+    """
+    Categorize files by magic number (--sniff).
+
+    Reads at most SNIFF_BYTES per file into a per-thread buffer that is reused
+    for every file. Results are cached by (inode, mtime, size) in
+    SNIFF_CACHE_NAME, so unchanged files are never read again on later runs.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.cache_path = root / SNIFF_CACHE_NAME
+        self.cache: Dict[str, str] = {}
+        self._local = threading.local()
+        self._dirty = False
+        try:
+            self.cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def _buffer(self) -> bytearray:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = bytearray(SNIFF_BYTES)
+        return buffer
+
+    def sniff(self, file: Path) -> str:
+        try:
+            st = os.stat(file)
+        except OSError:
+            return OTHER_CATEGORY
+        key = f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        category = OTHER_CATEGORY
+        buffer = self._buffer()
+        try:
+            with open(file, "rb", buffering=0) as f:
+                header = memoryview(buffer)[: f.readinto(buffer)]
+        except OSError:
+            return OTHER_CATEGORY
+        for offset, signature, cat in MAGIC_SIGNATURES:
+            if header[offset : offset + len(signature)] == signature:
+                category = cat
+                break
+
+        self.cache[key] = category
+        self._dirty = True
+        return category
+
+    def sniff_many(self, files: List[Path], workers: int = 1) -> Dict[Path, str]:
+        """Sniff a batch of files, on a thread pool when workers > 1."""
+        if workers > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                categories = list(pool.map(self.sniff, files, chunksize=64))
+        else:
+            categories = [self.sniff(file) for file in files]
+        return dict(zip(files, categories))
+
+    def save(self) -> None:
+        if self._dirty:
+            self.cache_path.write_text(json.dumps(self.cache), encoding="utf-8")
+            self._dirty = False
+
+
+class DuplicateFinder:
+    """
+    Find byte-identical files in stages, each reading more but on fewer files:
+    group by size, then by a BLAKE2 digest of the first and last 64 KiB, then
+    by a full BLAKE2 digest streamed through one reused buffer with readinto().
+    Digests are cached by (inode, mtime, size) in HASH_CACHE_NAME, so repeat
+    runs do not rehash unchanged files.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.cache_path = root / HASH_CACHE_NAME
+        self.cache: Dict[str, Dict[str, str]] = {}
+        self._buffer = bytearray(DEDUPE_READ_BYTES)
+        self._dirty = False
+        self.hashed_bytes = 0
+        try:
+            self.cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def _digest(self, file: Path, st: os.stat_result, kind: str) -> str:
+        key = f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+        cached = self.cache.get(key, {}).get(kind)
+        if cached is not None:
+            return cached
+
+        h = hashlib.blake2b(digest_size=20)
+        view = memoryview(self._buffer)
+        with open(file, "rb", buffering=0) as f:
+            if kind == "edges":
+                n = f.readinto(view[:DEDUPE_EDGE_BYTES])
+                h.update(view[:n])
+                if st.st_size > 2 * DEDUPE_EDGE_BYTES:
+                    f.seek(-DEDUPE_EDGE_BYTES, os.SEEK_END)
+                n2 = f.readinto(view[:DEDUPE_EDGE_BYTES])
+                h.update(view[:n2])
+                self.hashed_bytes += n + n2
+            else:
+                while True:
+                    n = f.readinto(view)
+                    if not n:
+                        break
+                    h.update(view[:n])
+                    self.hashed_bytes += n
+
+        digest = h.hexdigest()
+        self.cache.setdefault(key, {})[kind] = digest
+        self._dirty = True
+        return digest
+
+    def find(self, files: Iterable[Path]) -> List[List[Path]]:
+        """Return groups of identical files (each group has 2+ files, in the order given)."""
+        by_size: Dict[int, List[Tuple[Path, os.stat_result]]] = defaultdict(list)
+        seen_inodes: set = set()
+        for file in files:
+            try:
+                st = os.stat(file)
+            except OSError:
+                continue
+            if st.st_size == 0 or (st.st_dev, st.st_ino) in seen_inodes:
+                continue  # empty files, and files that are already hard links of each other
+            seen_inodes.add((st.st_dev, st.st_ino))
+            by_size[st.st_size].append((file, st))
+
+        groups: List[List[Path]] = []
+        for size, same_size in by_size.items():
+            if len(same_size) < 2:
+                continue
+            by_edges: Dict[str, list] = defaultdict(list)
+            for file, st in same_size:
+                by_edges[self._digest(file, st, "edges")].append((file, st))
+            for candidates in by_edges.values():
+                if len(candidates) < 2:
+                    continue
+                if size <= 2 * DEDUPE_EDGE_BYTES:
+                    # the edges already covered every byte
+                    groups.append([file for file, _ in candidates])
+                    continue
+                by_full: Dict[str, List[Path]] = defaultdict(list)
+                for file, st in candidates:
+                    by_full[self._digest(file, st, "full")].append(file)
+                groups.extend(group for group in by_full.values() if len(group) > 1)
+        return groups
+
+    def save(self) -> None:
+        if self._dirty:
+            self.cache_path.write_text(json.dumps(self.cache), encoding="utf-8")
+            self._dirty = False
+
+
+def dedupe_files(root: Path, files: List[Path], mode: str, dry_run: bool) -> None:
+    """Report duplicate files, or replace every copy but the first of each group with a hard link to it."""
+    finder = DuplicateFinder(root)
+    groups = finder.find(files)
+    if not dry_run:
+        finder.save()
+
+    duplicates = reclaimable = 0
+    for group in groups:
+        keep = group[0]
+        size = keep.stat().st_size
+        for dup in group[1:]:
+            duplicates += 1
+            reclaimable += size
+            if mode == "hardlink" and not dry_run:
+                tmp = dup.with_name(f".{dup.name}.{uuid.uuid4().hex[:8]}.link")
+                try:
+                    os.link(keep, tmp)
+                    os.replace(tmp, dup)
+                    report.emit(
+                        "hardlink", f"Hard-linked duplicate: {dup.name} -> {keep.name}", VERBOSE,
+                        path=str(dup), target=str(keep), size=size,
+                    )
+                except OSError as e:
+                    tmp.unlink(missing_ok=True)
+                    report.warning(
+                        f"Warning: could not hard-link {dup.name} to {keep.name}: {e}",
+                        path=str(dup), target=str(keep), error=str(e),
+                    )
+            else:
+                # Listing the duplicates is what --dedupe report is for, so show them by default
+                prefix = "[DRY-RUN] " if dry_run else ""
+                report.emit(
+                    "duplicate", f"{prefix}Duplicate: {dup} == {keep}", NORMAL,
+                    path=str(dup), target=str(keep), size=size,
+                )
+
+    report.info(
+        f"Dedupe: {len(groups)} group(s), {duplicates} duplicate file(s), {reclaimable:,} bytes "
+        f"{'reclaimed' if mode == 'hardlink' and not dry_run else 'reclaimable'} "
+        f"({finder.hashed_bytes:,} bytes hashed)",
+        event="dedupe_summary", groups=len(groups), duplicates=duplicates, bytes=reclaimable,
+    )
+
+
 def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
-def unique_destination(dst: Path) -> Path:
+class DirectoryCache:
+    """
+    Remembers which destination folders are known to exist.
+
+    ensure_dir() costs a mkdir() (plus a stat() when the folder is already
+    there) on every call; a run only ever files into a handful of category
+    folders, so after the first hit per folder ensure() is a set lookup.
+    ensure_many() creates a run's folders up front from one listing of the
+    parent. forget() drops a folder whose cached entry turned out stale
+    (deleted mid-run), so the next ensure() creates it again.
+    """
+
+    def __init__(self) -> None:
+        self._known: set = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, path: Path) -> None:
+        if path in self._known:
+            return
+        ensure_dir(path)
+        with self._lock:
+            self._known.add(path)
+
+    def ensure_many(self, paths: Iterable[Path]) -> None:
+        by_parent: Dict[Path, List[Path]] = defaultdict(list)
+        for path in set(paths) - self._known:
+            by_parent[path.parent].append(path)
+        for parent, children in by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    existing = {entry.name for entry in entries if entry.is_dir()}
+            except FileNotFoundError:
+                existing = set()
+            for path in children:
+                if path.name not in existing:
+                    ensure_dir(path)
+            with self._lock:
+                self._known.update(children)
+
+    def forget(self, path: Path) -> None:
+        with self._lock:
+            self._known.discard(path)
+
+
+def unique_destination(dst: Path, names: Optional["DestinationNames"] = None) -> Path:
     """If dst exists, append _1, _2, etc. before the suffix."""
+    if names is not None:
+        return names.reserve(dst)
     if not dst.exists():
         return dst
     stem, suffix = dst.stem, dst.suffix
@@ -113,15 +623,77 @@ def unique_destination(dst: Path) -> Path:
         i += 1
 
 
+class DestinationNames:
+    """
+    Collision-free destination names without probing the disk for every candidate.
+
+    Each destination folder is listed once (os.scandir) into a name set, and the
+    next _N suffix is remembered per stem, so picking a name is O(1) amortized
+    instead of one exists() per _1, _2, ... candidate. The chosen name still gets
+    a single exists() check, which catches files created by others mid-run.
+    Names are reserved as they are handed out, so concurrent workers never get
+    the same destination.
+    """
+
+    def __init__(self) -> None:
+        self._names: Dict[Path, set] = {}
+        self._next_suffix: Dict[Tuple[Path, str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _names_in(self, directory: Path) -> set:
+        names = self._names.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._names[directory] = names
+        return names
+
+    def _is_free(self, names: set, candidate: Path) -> bool:
+        if candidate.name in names:
+            return False
+        if candidate.exists():
+            names.add(candidate.name)
+            return False
+        return True
+
+    def reserve(self, dst: Path) -> Path:
+        parent = dst.parent
+        with self._lock:
+            names = self._names_in(parent)
+            candidate = dst
+            if not self._is_free(names, candidate):
+                stem, suffix = dst.stem, dst.suffix
+                key = (parent, stem, suffix)
+                i = self._next_suffix.get(key, 1)
+                while True:
+                    candidate = parent / f"{stem}_{i}{suffix}"
+                    i += 1
+                    if self._is_free(names, candidate):
+                        break
+                self._next_suffix[key] = i
+            names.add(candidate.name)
+            return candidate
+
+
 def iter_target_files(root: Path, include_hidden: bool) -> Iterable[Path]:
-    for p in root.iterdir():
-        if p.is_file():
-            if not include_hidden and p.name.startswith(('.', '~')):
+    # os.scandir() hands back the entry type with the name, so is_file() does not
+    # need a stat() per entry (except for symlinks) the way Path.is_file() does.
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if not include_hidden and entry.name.startswith(('.', '~')):
                 continue
-            yield p
+            if entry.is_file():
+                yield Path(entry.path)
 
 
-def load_move_log(root: Path) -> List[MoveRecord]:
+def new_run_id() -> str:
+    return f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+
+
+def load_legacy_move_log(root: Path) -> List[MoveRecord]:
     log_path = root / MOVE_LOG_NAME
     if not log_path.exists():
         return []
@@ -132,110 +704,1212 @@ def load_move_log(root: Path) -> List[MoveRecord]:
         return []
 
 
-def save_move_log(root: Path, records: List[MoveRecord]) -> None:
-    log_path = root / MOVE_LOG_NAME
-    payload = [rec.__dict__ for rec in records]
-    log_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+def iter_journal(root: Path, start: int = 0, end: Optional[int] = None) -> Iterable[MoveRecord]:
+    """Stream records from the journal (optionally only the byte range [start, end)), skipping torn lines."""
+    journal_path = root / JOURNAL_NAME
+    if not journal_path.exists():
+        return
+    with open(journal_path, "rb") as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            try:
+                yield MoveRecord(**json.loads(line))
+            except (ValueError, TypeError):
+                continue
+
+
+def load_move_log(root: Path) -> List[MoveRecord]:
+    return load_legacy_move_log(root) + list(iter_journal(root))
+
+
+def append_json_line(path: Path, payload: dict) -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(payload) + "\n")
+
+
+def load_run_index(root: Path) -> Dict[str, RunInfo]:
+    """
+    Read the run index: run id -> byte range of that run in the journal.
+
+    The index is itself append-only; a run gets a line when it starts, one when
+    it finishes and one if it is undone. A run that crashed before finishing
+    ends where the next run starts (or at the end of the journal).
+    """
+    runs: Dict[str, RunInfo] = {}
+    index_path = root / RUN_INDEX_NAME
+    if not index_path.exists():
+        return runs
+    with open(index_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                run = entry.pop("run")
+            except (ValueError, KeyError):
+                continue
+            if run in runs:
+                for field, value in entry.items():
+                    setattr(runs[run], field, value)
+            elif "start" in entry:
+                runs[run] = RunInfo(run=run, **entry)
+
+    journal_path = root / JOURNAL_NAME
+    journal_size = journal_path.stat().st_size if journal_path.exists() else 0
+    ordered = list(runs.values())
+    for info, following in zip(ordered, ordered[1:] + [None]):
+        if info.end is None:
+            info.end = following.start if following else journal_size
+    return runs
+
+
+def compact_journal(root: Path, force: bool = False) -> None:
+    """
+    Rewrite the journal (and its run index) keeping only runs that can still be undone.
+
+    Only runs when there is something to gain: a torn tail left by a crash, a
+    legacy JSON log to fold in, a missing index, or undone runs taking up more
+    than half of the journal. A normal run never reads the whole journal.
+    """
+    journal_path = root / JOURNAL_NAME
+    index_path = root / RUN_INDEX_NAME
+    legacy_path = root / MOVE_LOG_NAME
+    journal_size = journal_path.stat().st_size if journal_path.exists() else 0
+
+    torn = False
+    if journal_size:
+        with open(journal_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    runs = load_run_index(root)
+    undone_bytes = sum(info.end - info.start for info in runs.values() if info.undone)
+    needed = (
+        force
+        or torn
+        or legacy_path.exists()
+        or (journal_size and not index_path.exists())
+        or undone_bytes * 2 > journal_size
+    )
+    if not needed:
+        return
+
+    undone_runs = {run for run, info in runs.items() if info.undone}
+    legacy = load_legacy_move_log(root)
+    new_runs: Dict[str, RunInfo] = {}
+
+    tmp_journal = journal_path.with_name(JOURNAL_NAME + ".tmp")
+    with open(tmp_journal, "wb") as out:
+        for source in (legacy, iter_journal(root)):
+            for rec in source:
+                rec.run = rec.run or "legacy"
+                if rec.run in undone_runs:
+                    continue
+                info = new_runs.get(rec.run)
+                if info is None:
+                    info = new_runs[rec.run] = RunInfo(run=rec.run, start=out.tell())
+                out.write((json.dumps(asdict(rec)) + "\n").encode("utf-8"))
+                info.end = out.tell()
+                info.count += 1
+        out.flush()
+        os.fsync(out.fileno())
+
+    tmp_index = index_path.with_name(RUN_INDEX_NAME + ".tmp")
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        for info in new_runs.values():
+            f.write(json.dumps(asdict(info)) + "\n")
+
+    os.replace(tmp_journal, journal_path)
+    os.replace(tmp_index, index_path)
+    if legacy_path.exists():
+        legacy_path.unlink()
+
+
+class MoveJournal:
+    """
+    Append-only JSON Lines move journal for one run.
+
+    Each move is written (and flushed) as soon as it happens, so a crash mid-run
+    keeps every record up to the crash instead of losing the whole run. The
+    run's byte range is recorded in the run index so it can be undone on its own.
+    """
+
+    def __init__(self, root: Path, run_id: str) -> None:
+        self.root = root
+        self.run_id = run_id
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = open(root / JOURNAL_NAME, "ab")
+        self.start = self._file.seek(0, os.SEEK_END)
+        append_json_line(root / RUN_INDEX_NAME, {"run": run_id, "start": self.start})
+
+    def append(self, rec: MoveRecord) -> None:
+        rec.run = self.run_id
+        line = (json.dumps(asdict(rec)) + "\n").encode("utf-8")
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+
+    def close(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        end = self._file.tell()
+        self._file.close()
+        append_json_line(self.root / RUN_INDEX_NAME, {"run": self.run_id, "end": end, "count": self.count})
+
+    def __enter__(self) -> "MoveJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def file_digest(path: Path) -> bytes:
+    h = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def copy_file_data(src_fd: int, dst_fd: int, size: int) -> None:
+    """
+    Copy size bytes between two open files, in-kernel where possible.
+
+    Tries os.copy_file_range, then os.sendfile, then a plain read/write loop;
+    each step picks up at the offset the previous one reached (e.g. when
+    copy_file_range refuses to cross filesystems with EXDEV).
+    """
+    offset = 0
+    if hasattr(os, "copy_file_range"):
+        try:
+            while offset < size:
+                copied = os.copy_file_range(src_fd, dst_fd, min(COPY_CHUNK, size - offset), offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    if offset < size and hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        try:
+            os.lseek(dst_fd, offset, os.SEEK_SET)
+            while offset < size:
+                copied = os.sendfile(dst_fd, src_fd, offset, min(COPY_CHUNK, size - offset))
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    if offset < size:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+        os.lseek(dst_fd, offset, os.SEEK_SET)
+        while True:
+            chunk = os.read(src_fd, COPY_CHUNK)
+            if not chunk:
+                break
+            os.write(dst_fd, chunk)
 
 
-def move_file(src: Path, dst_dir: Path, dry_run: bool) -> Optional[MoveRecord]:
-    ensure_dir(dst_dir)
-    dst = unique_destination(dst_dir / src.name)
+class FileMover:
+    """
+    Move files with an atomic os.rename when source and destination share a
+    device (compared by st_dev up front), and through a copy pipeline otherwise.
+
+    Cross-device copies go to a temporary name in the destination folder, are
+    verified (size, plus a BLAKE2 digest with verify=True), then renamed into
+    place before the source is removed. At most copy_workers copies run at once.
+    """
+
+    def __init__(self, copy_workers: int = 2, verify: bool = False) -> None:
+        self.verify = verify
+        self._copy_slots = threading.BoundedSemaphore(max(1, copy_workers))
+        self._devices: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, List[int]] = {"rename": [0, 0], "copy": [0, 0]}  # path -> [files, bytes]
+
+    def _device(self, directory: Path) -> int:
+        device = self._devices.get(directory)
+        if device is None:
+            device = self._devices[directory] = os.stat(directory).st_dev
+        return device
+
+    def _count(self, path_taken: str, size: int) -> None:
+        with self._lock:
+            self.stats[path_taken][0] += 1
+            self.stats[path_taken][1] += size
+
+    def move(self, src: Path, dst: Path) -> str:
+        """Move src to dst (dst's folder must exist); returns 'rename' or 'copy'."""
+        st = os.stat(src)
+        if st.st_dev == self._device(dst.parent):
+            os.rename(src, dst)
+            self._count("rename", st.st_size)
+            return "rename"
+
+        with self._copy_slots:
+            self._copy(src, dst, st)
+        self._count("copy", st.st_size)
+        return "copy"
+
+    def _copy(self, src: Path, dst: Path, st: os.stat_result) -> None:
+        tmp = dst.with_name(f".{dst.name}.{uuid.uuid4().hex[:8]}.part")
+        try:
+            with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                copy_file_data(fsrc.fileno(), fdst.fileno(), st.st_size)
+                fdst.flush()
+                os.fsync(fdst.fileno())
+            copied_size = os.stat(tmp).st_size
+            if copied_size != st.st_size:
+                raise OSError(f"copy of {src} is {copied_size} bytes, expected {st.st_size}")
+            if self.verify and file_digest(src) != file_digest(tmp):
+                raise OSError(f"copy of {src} does not match the original")
+            shutil.copystat(src, tmp)
+            os.replace(tmp, dst)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        os.unlink(src)
+
+    def bytes_moved(self) -> int:
+        return self.stats["rename"][1] + self.stats["copy"][1]
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{path_taken}: {files} file(s), {size:,} bytes" for path_taken, (files, size) in self.stats.items()
+        )
+
+
+def _move(src: Path, dst: Path, mover: Optional[FileMover]) -> None:
+    if mover is not None:
+        mover.move(src, dst)
+    else:
+        shutil.move(str(src), str(dst))
+
+
+def move_file(
+    src: Path,
+    dst_dir: Path,
+    dry_run: bool,
+    names: Optional[DestinationNames] = None,
+    mover: Optional[FileMover] = None,
+    dirs: Optional[DirectoryCache] = None,
+) -> Optional[MoveRecord]:
+    dst = unique_destination(dst_dir / src.name, names)
     if dry_run:
-        print(f"[DRY-RUN] Move: {src} -> {dst}")
+        report.emit("move", f"[DRY-RUN] Move: {src} -> {dst}", VERBOSE, src=str(src), dst=str(dst), dry_run=True)
         return MoveRecord(str(src), str(dst))
-    shutil.move(str(src), str(dst))
-    print(f"Moved: {src.name} -> {dst.relative_to(dst_dir.parent)}")
+    if dirs is None:
+        dirs = DirectoryCache()
+    dirs.ensure(dst_dir)
+    try:
+        _move(src, dst, mover)
+    except FileNotFoundError:
+        if not src.exists():
+            raise
+        # The folder was cached but removed since; create it again and retry once.
+        dirs.forget(dst_dir)
+        dirs.ensure(dst_dir)
+        _move(src, dst, mover)
+    report.emit("move", f"Moved: {src.name} -> {dst.relative_to(dst_dir.parent)}", VERBOSE, src=str(src), dst=str(dst))
     return MoveRecord(str(src), str(dst))
 
 
-def maybe_extract_zip(dst_file: Path, dry_run: bool) -> None:
-    # Extract only .zip and .tar.* archives
+class ExtractLimitExceeded(Exception):
+    pass
+
+
+def extract_dir_for(archive: Path) -> Optional[Path]:
+    """Folder an archive extracts into (named like the file, compound suffix removed), or None if not extractable."""
+    suffix = file_suffix(archive.name)
+    if suffix == ".zip" or suffix in TAR_SUFFIXES:
+        return archive.with_name(archive.name[: -len(suffix)])
+    return None
+
+
+def extract_archive(archive: str, max_bytes: int, max_entries: int) -> Tuple[bool, str]:
+    """
+    Extract one .zip or .tar.* archive, streaming member by member.
+
+    Members are written into a temporary folder that is renamed into place only
+    when the whole archive fits the byte and entry budgets, so a pathological
+    archive leaves nothing behind. Paths escaping the folder, links and device
+    entries are refused/skipped. Returns (ok, message); runs in a worker process.
+    """
+    dst_file = Path(archive)
+    extract_dir = extract_dir_for(dst_file)
+    if extract_dir is None:
+        return False, f"Skip: not an extractable archive: {dst_file.name}"
+    tmp_dir = extract_dir.with_name(f".{extract_dir.name}.{uuid.uuid4().hex[:8]}.extracting")
+    entries = total = 0
+
+    def target_for(member_name: str) -> Path:
+        nonlocal entries
+        entries += 1
+        if entries > max_entries:
+            raise ExtractLimitExceeded(f"more than {max_entries:,} entries")
+        target = (tmp_dir / member_name).resolve()
+        if not target.is_relative_to(tmp_dir.resolve()):
+            raise ValueError(f"member escapes the extract folder: {member_name}")
+        return target
+
+    def stream(fsrc, target: Path) -> None:
+        nonlocal total
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as fdst:
+            for chunk in iter(lambda: fsrc.read(EXTRACT_CHUNK), b""):
+                total += len(chunk)  # counted as written, declared sizes can lie
+                if total > max_bytes:
+                    raise ExtractLimitExceeded(f"more than {max_bytes:,} uncompressed bytes")
+                fdst.write(chunk)
+
     try:
-        if dst_file.suffix.lower() == ".zip":
-            extract_dir = dst_file.with_suffix("")  # folder named like the file
-            if dry_run:
-                print(f"[DRY-RUN] Extract zip: {dst_file} -> {extract_dir}")
-                return
-            ensure_dir(extract_dir)
+        tmp_dir.mkdir()
+        if dst_file.name.lower().endswith(".zip"):
             with zipfile.ZipFile(dst_file, "r") as zf:
-                zf.extractall(extract_dir)
-            print(f"Extracted zip: {dst_file.name} -> {extract_dir.name}")
-        elif dst_file.suffix.lower() in {".tar", ".gz", ".tgz", ".bz2", ".tbz2", ".xz"}:
-            # Handle tarballs (tar.{gz,bz2,xz}) and plain tar
-            extract_dir = dst_file.with_suffix("")
-            if dry_run:
-                print(f"[DRY-RUN] Extract tar: {dst_file} -> {extract_dir}")
-                return
-            ensure_dir(extract_dir)
-            with tarfile.open(dst_file, "r:*") as tf:
-                tf.extractall(extract_dir)
-            print(f"Extracted tar archive: {dst_file.name} -> {extract_dir.name}")
-    except (zipfile.BadZipFile, tarfile.ReadError) as e:
-        print(f"Warning: failed to extract {dst_file.name}: {e}")
-
-
-def undo_moves(root: Path, dry_run: bool) -> None:
-    records = load_move_log(root)
-    if not records:
-        print("No move log found or log is empty. Nothing to undo.")
+                for info in zf.infolist():
+                    target = target_for(info.filename)
+                    if info.is_dir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    if total + info.file_size > max_bytes:
+                        raise ExtractLimitExceeded(f"more than {max_bytes:,} uncompressed bytes")
+                    with zf.open(info) as fsrc:
+                        stream(fsrc, target)
+        else:
+            # "r|*" reads the tarball as a stream, one member at a time
+            with tarfile.open(dst_file, "r|*") as tf:
+                for member in tf:
+                    target = target_for(member.name)
+                    if member.isdir():
+                        target.mkdir(parents=True, exist_ok=True)
+                    elif member.isfile():
+                        if total + member.size > max_bytes:
+                            raise ExtractLimitExceeded(f"more than {max_bytes:,} uncompressed bytes")
+                        stream(tf.extractfile(member), target)
+        final_dir = unique_destination(extract_dir)
+        os.rename(tmp_dir, final_dir)
+    except (zipfile.BadZipFile, tarfile.TarError, ExtractLimitExceeded, ValueError, OSError) as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return False, f"Warning: failed to extract {dst_file.name}: {e}"
+    return True, f"Extracted: {dst_file.name} -> {final_dir.name} ({entries:,} entries, {total:,} bytes)"
+
+
+def maybe_extract_zip(
+    dst_file: Path,
+    dry_run: bool,
+    max_bytes: int = DEFAULT_MAX_EXTRACT_BYTES,
+    max_entries: int = DEFAULT_MAX_EXTRACT_ENTRIES,
+) -> None:
+    # Extract only .zip and .tar.* archives
+    extract_dir = extract_dir_for(dst_file)
+    if extract_dir is None:
         return
+    if dry_run:
+        report.emit(
+            "extract", f"[DRY-RUN] Extract: {dst_file} -> {extract_dir}", VERBOSE,
+            archive=str(dst_file), dst=str(extract_dir), dry_run=True,
+        )
+        return
+    report_extraction(str(dst_file), *extract_archive(str(dst_file), max_bytes, max_entries))
 
-    # Undo in reverse order (safer)
-    undone: List[MoveRecord] = []
-    for rec in reversed(records):
-        src = Path(rec.src)
-        dst = Path(rec.dst)
-        if not dst.exists():
-            print(f"Skip: Destination missing (already moved/removed): {dst}")
-            continue
-        target_dir = src.parent
-        ensure_dir(target_dir)
-        final_path = unique_destination(target_dir / dst.name)
-        if dry_run:
-            print(f"[DRY-RUN] Undo move: {dst} -> {final_path}")
-            undone.append(MoveRecord(str(dst), str(final_path)))
+
+def report_extraction(archive: str, ok: bool, message: str) -> None:
+    if ok:
+        report.emit("extract", message, VERBOSE, archive=archive, ok=True)
+    else:
+        report.warning(message, event="extract", archive=archive, ok=False)
+
+
+def extract_archives_stage(
+    archives: List[Path],
+    dry_run: bool,
+    workers: int,
+    max_bytes: int = DEFAULT_MAX_EXTRACT_BYTES,
+    max_entries: int = DEFAULT_MAX_EXTRACT_ENTRIES,
+) -> None:
+    """Extract the archives moved by this run, after all moves, across a process pool."""
+    archives = [a for a in archives if extract_dir_for(a) is not None]
+    if not archives:
+        return
+    if dry_run:
+        for archive in archives:
+            maybe_extract_zip(archive, dry_run=dry_run, max_bytes=max_bytes, max_entries=max_entries)
+        report.info(f"[DRY-RUN] Would extract {len(archives)} archive(s)", event="extract_summary", total=len(archives))
+        return
+
+    paths = [str(a) for a in archives]
+    extracted = 0
+    with report.progress("Extracting", total=len(paths)) as progress:
+        if workers <= 1 or len(paths) == 1:
+            results: Iterable[Tuple[bool, str]] = (extract_archive(path, max_bytes, max_entries) for path in paths)
+            pool = None
         else:
-            shutil.move(str(dst), str(final_path))
-            print(f"Undo: {dst} -> {final_path}")
-            undone.append(MoveRecord(str(dst), str(final_path)))
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(paths)))
+            results = pool.map(extract_archive, paths, [max_bytes] * len(paths), [max_entries] * len(paths))
+        try:
+            for path, (ok, message) in zip(paths, results):
+                extracted += ok
+                report_extraction(path, ok, message)
+                progress.advance()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    report.info(
+        f"Extracted {extracted} of {len(paths)} archive(s)",
+        event="extract_summary", extracted=extracted, total=len(paths),
+    )
+
+
+def undo_records(records: List[MoveRecord], dry_run: bool) -> int:
+    """Move each record's file back next to where it came from; returns how many were undone."""
+    undone = 0
+    names = DestinationNames()
+    dirs = DirectoryCache()
+    with report.progress("Undoing", total=len(records)) as progress:
+        for rec in records:
+            progress.advance()
+            src = Path(rec.src)
+            dst = Path(rec.dst)
+            if not dst.exists():
+                report.emit(
+                    "undo_skip", f"Skip: Destination missing (already moved/removed): {dst}", VERBOSE,
+                    src=rec.src, dst=rec.dst,
+                )
+                continue
+            target_dir = src.parent
+            if not dry_run:
+                dirs.ensure(target_dir)
+            final_path = unique_destination(target_dir / dst.name, names)
+            if dry_run:
+                report.emit(
+                    "undo", f"[DRY-RUN] Undo move: {dst} -> {final_path}", VERBOSE,
+                    src=rec.dst, dst=str(final_path), dry_run=True,
+                )
+            else:
+                shutil.move(str(dst), str(final_path))
+                report.emit("undo", f"Undo: {dst} -> {final_path}", VERBOSE, src=rec.dst, dst=str(final_path))
+            undone += 1
+    skipped = len(records) - undone
+    if skipped:
+        report.info(f"Skipped {skipped} move(s) whose file is no longer there", event="undo_skipped", skipped=skipped)
+    return undone
+
+
+def undo_moves(root: Path, dry_run: bool, run_id: Optional[str] = None, last: bool = False) -> None:
+    """Undo every logged move, or (with run_id/last) only the moves of a single run."""
+    if run_id is None and not last:
+        # Runs undone earlier stay in the journal until it is compacted; replaying them
+        # would move out whatever has since been put at their old destinations.
+        undone_runs = {run for run, info in load_run_index(root).items() if info.undone}
+        records = [rec for rec in load_move_log(root) if rec.run not in undone_runs]
+        if not records:
+            report.info("No move log found or log is empty. Nothing to undo.")
+            return
+
+        # Undo in reverse order (safer)
+        undone = undo_records(records[::-1], dry_run=dry_run)
+
+        if not dry_run:
+            # Clear the move log after successful undo
+            (root / JOURNAL_NAME).write_text("", encoding="utf-8")
+            (root / RUN_INDEX_NAME).unlink(missing_ok=True)
+            (root / MOVE_LOG_NAME).unlink(missing_ok=True)
+            report.info(f"Undid {undone} move(s). Move log cleared.", event="undo_summary", undone=undone)
+        else:
+            report.info(f"[DRY-RUN] Would undo {undone} move(s)", event="undo_summary", undone=undone, dry_run=True)
+        return
+
+    if not dry_run:
+        compact_journal(root)  # make sure the run index covers the whole journal
+    runs = load_run_index(root)
+    if last:
+        candidates = [info for info in runs.values() if not info.undone and info.end > info.start]
+        info = candidates[-1] if candidates else None
+    else:
+        info = runs.get(run_id)
+    if info is None or info.undone:
+        report.info(f"No undoable run found{f' with id {run_id}' if run_id else ''}. Nothing to undo.")
+        return
+
+    # Only this run's slice of the journal is read, newest move first.
+    records = [rec for rec in iter_journal(root, info.start, info.end) if rec.run == info.run]
+    undone = undo_records(records[::-1], dry_run=dry_run)
 
     if not dry_run:
-        # Clear the move log after successful undo
-        (root / MOVE_LOG_NAME).write_text("[]", encoding="utf-8")
-        print("Move log cleared.")
+        append_json_line(root / RUN_INDEX_NAME, {"run": info.run, "undone": True})
+        compact_journal(root)
+        report.info(f"Undid {undone} move(s) from run {info.run}.", event="undo_summary", undone=undone, run=info.run)
+    else:
+        report.info(
+            f"[DRY-RUN] Would undo {undone} move(s) from run {info.run}.",
+            event="undo_summary", undone=undone, run=info.run, dry_run=True,
+        )
+
+
+def list_runs(root: Path) -> None:
+    runs = load_run_index(root)
+    if not runs:
+        report.emit("run", "No runs recorded.", QUIET)
+    for info in runs.values():
+        state = "undone" if info.undone else "active"
+        report.emit("run", f"{info.run}  {info.count:>8} move(s)  {state}", QUIET, run=info.run, count=info.count, state=state)
+
+
+class TreeSnapshot:
+    """
+    Compact per-folder snapshot of the tree for --recursive runs.
+
+    For every folder it keeps the folder's mtime, its subfolders and its files
+    (name -> [size, mtime_ns, category]). A folder whose mtime has not changed
+    still has the same entries, so it is not listed again and its files are not
+    stat()ed; only folders with added/removed/renamed entries are re-read, and
+    only their new or changed files come back from scan(). The cost of a run is
+    proportional to what changed, not to the size of the tree.
+    """
+
+    VERSION = 1
 
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.dirs: Dict[str, dict] = {}  # relative folder ("" is root) -> {"mtime", "subdirs", "files"}
+        self._touched: Dict[str, Optional[int]] = {}  # folder this run moved files in/out of -> mtime right after
 
-def organize(root: Path, dry_run: bool, include_hidden: bool, extract_archives: bool) -> None:
+    @classmethod
+    def load(cls, root: Path) -> "TreeSnapshot":
+        snapshot = cls(root)
+        try:
+            payload = json.loads((root / SNAPSHOT_NAME).read_text(encoding="utf-8"))
+            if payload.get("version") == cls.VERSION:
+                snapshot.dirs = payload["dirs"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return snapshot
+
+    def _path(self, rel: str) -> Path:
+        return self.root / rel if rel else self.root
+
+    def scan(self, include_hidden: bool) -> List[Path]:
+        """Walk the tree, reusing unchanged folders; returns the new/changed files that need organizing."""
+        category_dirs = set(CATEGORY_MAP) | {OTHER_CATEGORY}
+        old, new = self.dirs, {}
+        candidates: List[Path] = []
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            try:
+                mtime = os.stat(self._path(rel)).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            previous = old.get(rel)
+            if previous and previous["mtime"] == mtime:
+                new[rel] = previous
+                stack.extend(f"{rel}/{name}" if rel else name for name in previous["subdirs"])
+                continue
+
+            # Category folders are destinations: only their own files are checked
+            # (to catch misfiled ones), never their subfolders (extracted archives).
+            in_category = rel in category_dirs
+            known = previous["files"] if previous else {}
+            files: Dict[str, list] = {}
+            subdirs: List[str] = []
+            with os.scandir(self._path(rel)) as entries:
+                for entry in entries:
+                    if not include_hidden and entry.name.startswith((".", "~")):
+                        continue
+                    if not rel and entry.name in RESERVED_NAMES:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if not in_category:
+                            subdirs.append(entry.name)
+                            stack.append(f"{rel}/{entry.name}" if rel else entry.name)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                    signature = [st.st_size, st.st_mtime_ns]
+                    seen = known.get(entry.name)
+                    if seen and seen[:2] == signature:
+                        files[entry.name] = seen
+                        continue
+                    category = categorize(Path(entry.path))
+                    files[entry.name] = signature + [category]
+                    if not (in_category and rel == category):
+                        candidates.append(Path(entry.path))
+            new[rel] = {"mtime": mtime, "subdirs": subdirs, "files": files}
+
+        self.dirs = new
+        return candidates
+
+    def _rel(self, path: Path) -> str:
+        rel = path.relative_to(self.root).as_posix()
+        return "" if rel == "." else rel
+
+    def _touch(self, rel: str) -> None:
+        try:
+            self._touched[rel] = os.stat(self._path(rel)).st_mtime_ns
+        except FileNotFoundError:
+            self._touched[rel] = None
+
+    def record(self, file: Path, rec: Optional[MoveRecord]) -> None:
+        """Update the snapshot for a scanned file: moved (rec) or left for the next run (None)."""
+        src_rel = self._rel(file.parent)
+        self.dirs.get(src_rel, {}).get("files", {}).pop(file.name, None)
+        if rec is None:
+            return  # forgotten, so the next scan offers it again
+        self._touch(src_rel)
+
+        dst = Path(rec.dst)
+        dst_rel = self._rel(dst.parent)
+        if dst_rel not in self.dirs:
+            self.dirs[dst_rel] = {"mtime": 0, "subdirs": [], "files": {}}
+            parent = self.dirs.setdefault(self._rel(dst.parent.parent), {"mtime": 0, "subdirs": [], "files": {}})
+            parent["subdirs"].append(dst.parent.name)
+            self._touch(self._rel(dst.parent.parent))
+        st = dst.stat()
+        self.dirs[dst_rel]["files"][dst.name] = [st.st_size, st.st_mtime_ns, dst.parent.name]
+        self._touch(dst_rel)
+
+    def save(self) -> None:
+        # A folder this run moved files in/out of takes the mtime it had right after our
+        # last move there. If it changed since (a file arrived mid-run), the old mtime is
+        # kept so the next scan lists the folder again.
+        for rel, ours in self._touched.items():
+            try:
+                mtime = os.stat(self._path(rel)).st_mtime_ns
+            except FileNotFoundError:
+                self.dirs.pop(rel, None)
+                continue
+            if mtime == ours and rel in self.dirs:
+                self.dirs[rel]["mtime"] = mtime
+        self._touched.clear()
+        payload = {"version": self.VERSION, "dirs": self.dirs}
+        tmp_path = self.root / (SNAPSHOT_NAME + ".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.root / SNAPSHOT_NAME)
+
+
+def organize(
+    root: Path,
+    dry_run: bool,
+    include_hidden: bool,
+    extract_archives: bool,
+    workers: int = 1,
+    sniff: bool = False,
+    copy_workers: int = 2,
+    verify_copies: bool = False,
+    extract_workers: int = 1,
+    max_extract_bytes: int = DEFAULT_MAX_EXTRACT_BYTES,
+    max_extract_entries: int = DEFAULT_MAX_EXTRACT_ENTRIES,
+    recursive: bool = False,
+    dedupe: Optional[str] = None,
+    plan_path: Optional[Path] = None,
+) -> None:
     if not root.exists() or not root.is_dir():
-        print(f"Error: target path does not exist or is not a directory: {root}")
+        report.warning(f"Error: target path does not exist or is not a directory: {root}", event="error")
         sys.exit(2)
 
-    moves: List[MoveRecord] = []
-    for file in iter_target_files(root, include_hidden=include_hidden):
-        # Don't touch our own log
-        if file.name == MOVE_LOG_NAME:
-            continue
-        category = categorize(file)
+    mover = FileMover(copy_workers=copy_workers, verify=verify_copies)
+
+    # Shared by all workers; reserves each destination name as it is handed out.
+    names = DestinationNames()
+
+    snapshot: Optional[TreeSnapshot] = None
+    if recursive:
+        snapshot = TreeSnapshot.load(root)
+        files = snapshot.scan(include_hidden=include_hidden)
+        report.info(f"Recursive scan: {len(files)} new or changed file(s)", event="scan", files=len(files))
+    else:
+        # Don't touch our own log (or other bookkeeping files)
+        files = [f for f in iter_target_files(root, include_hidden=include_hidden) if f.name not in RESERVED_NAMES]
+
+    # Extensions are trusted when known; only files that would land in "Other"
+    # get their header read, as one batch before any moves start.
+    sniffed: Dict[Path, str] = {}
+    if sniff:
+        sniffer = ContentSniffer(root)
+        sniffed = sniffer.sniff_many([f for f in files if categorize(f) == OTHER_CATEGORY], workers=workers)
+        if not dry_run and plan_path is None:
+            sniffer.save()
+
+    if plan_path is not None:
+        write_plan(root, files, sniffed, plan_path)
+        return
+
+    if dedupe:
+        dedupe_files(root, files, mode=dedupe, dry_run=dry_run)
+
+    # Categorize once up front so every category folder the run needs is
+    # created in one batch, instead of a mkdir() per moved file.
+    categories = {file: sniffed.get(file) or categorize(file) for file in files}
+    dirs = DirectoryCache()
+    if not dry_run:
+        dirs.ensure_many(
+            root / category for file, category in categories.items() if file.parent != root / category
+        )
+
+    run_id = new_run_id()
+    journal: Optional[MoveJournal] = None
+    if not dry_run:
+        compact_journal(root)
+        journal = MoveJournal(root, run_id)
+
+    def process(file: Path) -> Optional[MoveRecord]:
+        category = categories[file]
         dst_dir = root / category
-        rec = move_file(file, dst_dir, dry_run=dry_run)
-        if rec:
-            moves.append(rec)
-
-            if extract_archives and category == "Archives":
-                # After move, consider extraction
-                moved_path = Path(rec.dst)
-                maybe_extract_zip(moved_path, dry_run=dry_run)
-
-    if moves and not dry_run:
-        # Append to existing log if present
-        existing = load_move_log(root)
-        save_move_log(root, existing + moves)
-        print(f"Logged {len(moves)} move(s) to {root / MOVE_LOG_NAME}")
-    elif moves and dry_run:
-        print(f"[DRY-RUN] Would log {len(moves)} move(s) to {root / MOVE_LOG_NAME}")
+        if file.parent == dst_dir:
+            return None  # already filed (recursive runs look inside the category folders too)
+        rec = move_file(file, dst_dir, dry_run=dry_run, names=names, mover=mover, dirs=dirs)
+
+        if rec and journal:
+            journal.append(rec)
+        if rec and extract_archives and category == "Archives":
+            # Extracted in a separate stage once every file has been moved
+            archives.append(Path(rec.dst))
+        return rec
+
+    archives: List[Path] = []
+    processed = moved = 0
+    started = time.perf_counter()
+    progress = report.progress("Planning" if dry_run else "Moving", total=len(files), bytes_done=mover.bytes_moved)
+    try:
+        with progress:
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results: Iterable[Optional[MoveRecord]] = pool.map(process, files)
+                    for file, rec in zip(files, results):
+                        processed += 1
+                        moved += rec is not None
+                        progress.advance()
+                        if snapshot and not dry_run:
+                            snapshot.record(file, rec)
+            else:
+                for file in files:
+                    rec = process(file)
+                    processed += 1
+                    moved += rec is not None
+                    progress.advance()
+                    if snapshot and not dry_run:
+                        snapshot.record(file, rec)
+    finally:
+        if journal:
+            journal.close()
+    elapsed = time.perf_counter() - started
+
+    if archives:
+        extract_archives_stage(
+            archives,
+            dry_run=dry_run,
+            workers=extract_workers,
+            max_bytes=max_extract_bytes,
+            max_entries=max_extract_entries,
+        )
+
+    if snapshot and not dry_run:
+        snapshot.save()
+
+    if processed:
+        rate = processed / elapsed if elapsed > 0 else float(processed)
+        report.info(
+            f"Processed {processed} file(s) in {elapsed:.2f}s ({rate:,.0f} files/sec)",
+            event="summary", processed=processed, moved=moved, seconds=round(elapsed, 3), dry_run=dry_run,
+        )
+
+    if moved and not dry_run:
+        report.info(f"Moves by path: {mover.summary()}", event="move_paths", **mover.stats)
+        report.info(f"Logged {moved} move(s) to {root / JOURNAL_NAME} (run {run_id})", event="run_logged", run=run_id)
+    elif moved and dry_run:
+        report.info(f"[DRY-RUN] Would log {moved} move(s) to {root / JOURNAL_NAME} (-v lists them)")
     else:
-        print("No files moved (nothing to do).")
+        report.info("No files moved (nothing to do).")
+
+
+def write_plan(root: Path, files: List[Path], sniffed: Dict[Path, str], plan_path: Path) -> None:
+    """
+    Write the moves a run would make as JSON Lines, without touching the tree.
+
+    The first line is a header; every other line is one move with the source's
+    size and mtime, so --apply can tell whether the file changed since planning.
+    Destination names are resolved (collisions included) but nothing is created.
+    """
+    names = DestinationNames()
+    planned = 0
+    started = time.perf_counter()
+    with open(plan_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"plan": PLAN_VERSION, "root": str(root), "created": f"{datetime.now():%Y-%m-%dT%H:%M:%S}"}) + "\n")
+        for file in files:
+            category = sniffed.get(file) or categorize(file)
+            dst_dir = root / category
+            if file.parent == dst_dir:
+                continue
+            try:
+                st = os.stat(file)
+            except FileNotFoundError:
+                continue
+            dst = unique_destination(dst_dir / file.name, names)
+            entry = {
+                "src": str(file),
+                "dst": str(dst),
+                "category": category,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+            f.write(json.dumps(entry) + "\n")
+            planned += 1
+    elapsed = time.perf_counter() - started
+    report.info(
+        f"Planned {planned} move(s) in {elapsed:.2f}s -> {plan_path}",
+        event="plan_summary", planned=planned, plan=str(plan_path),
+    )
+
+
+def read_plan_header(f: TextIO, plan_path: Path) -> dict:
+    header = json.loads(f.readline() or "{}")
+    if header.get("plan") != PLAN_VERSION or "root" not in header:
+        raise ValueError(f"{plan_path} is not a version {PLAN_VERSION} move plan")
+    return header
+
+
+def plan_root(plan_path: Path) -> Path:
+    """The folder a plan was made for (its journal and run index live there)."""
+    with open(plan_path, encoding="utf-8") as f:
+        return Path(read_plan_header(f, plan_path)["root"])
+
+
+def iter_plan(plan_path: Path) -> Iterable[dict]:
+    with open(plan_path, encoding="utf-8") as f:
+        read_plan_header(f, plan_path)
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def apply_plan(
+    root: Path,
+    plan_path: Path,
+    workers: int = 1,
+    extract_archives: bool = False,
+    copy_workers: int = 2,
+    verify_copies: bool = False,
+    extract_workers: int = 1,
+    max_extract_bytes: int = DEFAULT_MAX_EXTRACT_BYTES,
+    max_extract_entries: int = DEFAULT_MAX_EXTRACT_ENTRIES,
+) -> None:
+    """
+    Execute a plan written by --plan: no scanning or categorizing, just the moves.
+
+    Entries whose source is gone or changed (size/mtime) since planning are
+    skipped; a destination taken in the meantime gets the next free _N name.
+    """
+    try:
+        entries = iter_plan(plan_path)
+        first = next(entries, None)
+    except (OSError, ValueError) as e:
+        report.warning(f"Error: cannot read plan: {e}", event="error")
+        sys.exit(2)
+
+    names = DestinationNames()
+    mover = FileMover(copy_workers=copy_workers, verify=verify_copies)
+    dirs = DirectoryCache()
+    archives: List[Path] = []
+
+    def execute(entry: dict) -> Optional[MoveRecord]:
+        src = Path(entry["src"])
+        try:
+            st = os.stat(src)
+        except FileNotFoundError:
+            report.emit("skip", f"Skip: source missing: {src}", VERBOSE, src=str(src), reason="missing")
+            return None
+        if (st.st_size, st.st_mtime_ns) != (entry["size"], entry["mtime_ns"]):
+            report.emit("skip", f"Skip: changed since planning: {src}", VERBOSE, src=str(src), reason="changed")
+            return None
+        dst = Path(entry["dst"])
+        dirs.ensure(dst.parent)
+        dst = unique_destination(dst, names)
+        mover.move(src, dst)
+        report.emit("move", f"Moved: {src.name} -> {dst.relative_to(dst.parent.parent)}", VERBOSE, src=str(src), dst=str(dst))
+        rec = MoveRecord(str(src), str(dst))
+        journal.append(rec)
+        if extract_archives and entry.get("category") == "Archives":
+            archives.append(dst)
+        return rec
+
+    compact_journal(root)
+    run_id = new_run_id()
+    journal = MoveJournal(root, run_id)
+    planned = moved = 0
+    started = time.perf_counter()
+    try:
+        remaining = itertools.chain([first] if first is not None else [], entries)
+        with report.progress("Applying", bytes_done=mover.bytes_moved) as progress:
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    while True:
+                        chunk = list(itertools.islice(remaining, APPLY_CHUNK))
+                        if not chunk:
+                            break
+                        planned += len(chunk)
+                        for rec in pool.map(execute, chunk):
+                            moved += rec is not None
+                            progress.advance()
+            else:
+                for entry in remaining:
+                    planned += 1
+                    moved += execute(entry) is not None
+                    progress.advance()
+    finally:
+        journal.close()
+    elapsed = time.perf_counter() - started
+
+    if archives:
+        extract_archives_stage(
+            archives,
+            dry_run=False,
+            workers=extract_workers,
+            max_bytes=max_extract_bytes,
+            max_entries=max_extract_entries,
+        )
+
+    rate = moved / elapsed if elapsed > 0 else float(moved)
+    report.info(
+        f"Applied {moved} move(s), skipped {planned - moved}, in {elapsed:.2f}s ({rate:,.0f} files/sec)",
+        event="summary", processed=planned, moved=moved, seconds=round(elapsed, 3),
+    )
+    if moved:
+        report.info(f"Moves by path: {mover.summary()}", event="move_paths", **mover.stats)
+        report.info(f"Logged {moved} move(s) to {root / JOURNAL_NAME} (run {run_id})", event="run_logged", run=run_id)
+
+
+class InotifyWatcher:
+    """Minimal inotify binding (ctypes, Linux only) reporting names created/moved/written in one folder."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (name follows, NUL padded)
+
+    def __init__(self, root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(root), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {root}")
+        self.root = root
+
+    def wait(self, timeout: Optional[float]) -> List[str]:
+        """Block (no CPU) until events arrive or timeout expires; returns the affected names."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names: List[str] = []
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            if mask & self.IN_Q_OVERFLOW:
+                # events were dropped; fall back to listing the folder once
+                names.extend(entry.name for entry in os.scandir(self.root))
+            elif length:
+                names.append(os.fsdecode(data[offset : offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback for platforms without inotify: lists the folder every poll_interval seconds."""
+
+    def __init__(self, root: Path, poll_interval: float) -> None:
+        self.root = root
+        self.poll_interval = poll_interval
+        self._seen = self._names()
+
+    def _names(self) -> set:
+        with os.scandir(self.root) as entries:
+            return {entry.name for entry in entries}
+
+    def wait(self, timeout: Optional[float]) -> List[str]:
+        time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+        current = self._names()
+        new = current - self._seen
+        self._seen = current
+        return list(new)
+
+    def close(self) -> None:
+        pass
+
+
+def watch(
+    root: Path,
+    dry_run: bool,
+    include_hidden: bool,
+    extract_archives: bool,
+    sniff: bool = False,
+    debounce: float = DEFAULT_WATCH_DEBOUNCE,
+    poll_interval: float = DEFAULT_WATCH_POLL_INTERVAL,
+) -> None:
+    """
+    Keep a folder organized: handle only files that arrive after the watch starts.
+
+    A file is moved once it has been quiet (same size and mtime) for `debounce`
+    seconds, so files still being written or downloaded are left alone. Between
+    events the process sleeps in select() (inotify) or time.sleep() (polling).
+    """
+    if not root.exists() or not root.is_dir():
+        report.warning(f"Error: target path does not exist or is not a directory: {root}", event="error")
+        sys.exit(2)
+
+    try:
+        watcher = InotifyWatcher(root)
+        report.info(f"Watching {root} (inotify). Press Ctrl+C to stop.")
+    except (OSError, AttributeError):
+        watcher = PollingWatcher(root, poll_interval)
+        report.info(f"Watching {root} (polling every {poll_interval}s). Press Ctrl+C to stop.")
+
+    names = DestinationNames()
+    mover = FileMover()
+    dirs = DirectoryCache()
+    sniffer = ContentSniffer(root) if sniff else None
+    run_id = new_run_id()
+    journal: Optional[MoveJournal] = None
+    if not dry_run:
+        compact_journal(root)
+        journal = MoveJournal(root, run_id)
+
+    # Stop cleanly (journal closed, index written) when a service manager sends SIGTERM
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    # name -> [deadline, (size, mtime_ns) at the last check]
+    pending: Dict[str, list] = {}
+    moved = 0
+    try:
+        while True:
+            now = time.monotonic()
+            timeout = max(0.0, min(deadline for deadline, _ in pending.values()) - now) if pending else None
+            for name in watcher.wait(timeout):
+                if name in RESERVED_NAMES or (not include_hidden and name.startswith((".", "~"))):
+                    continue
+                pending[name] = [time.monotonic() + debounce, None]
+
+            now = time.monotonic()
+            for name, (deadline, last_seen) in list(pending.items()):
+                if deadline > now:
+                    continue
+                file = root / name
+                try:
+                    st = file.stat()
+                except FileNotFoundError:
+                    del pending[name]
+                    continue
+                if not file.is_file():
+                    del pending[name]
+                    continue
+                seen = (st.st_size, st.st_mtime_ns)
+                if seen != last_seen:
+                    # still changing (or first check): wait for another quiet period
+                    pending[name] = [now + debounce, seen]
+                    continue
+                del pending[name]
+
+                category = categorize(file)
+                if sniffer and category == OTHER_CATEGORY:
+                    category = sniffer.sniff(file)
+                try:
+                    rec = move_file(file, root / category, dry_run=dry_run, names=names, mover=mover, dirs=dirs)
+                except OSError as e:
+                    # e.g. no permission, or the file went away after the quiet period: keep watching
+                    report.warning(
+                        f"Warning: could not move {file.name}: {e}",
+                        path=str(file), error=str(e),
+                    )
+                    continue
+                if rec and journal:
+                    journal.append(rec)
+                    moved += 1
+                if rec and extract_archives and category == "Archives":
+                    maybe_extract_zip(Path(rec.dst), dry_run=dry_run)
+    except KeyboardInterrupt:
+        report.info("", event="stop")
+    finally:
+        watcher.close()
+        if sniffer and not dry_run:
+            sniffer.save()
+        if journal:
+            journal.close()
+            report.info(f"Logged {moved} move(s) to {root / JOURNAL_NAME} (run {run_id})", event="run_logged", run=run_id)
+
+
+def benchmark_categorize(count: int) -> None:
+    """Time categorize() against the original linear scan on synthetic file names."""
+    extensions = list(EXTENSION_CATEGORY) + [".unknown", ""]
+    files = [Path(f"file_{i}{extensions[i % len(extensions)]}") for i in range(count)]
+    files += [Path(f"Screenshot {i}.png") for i in range(count // 10)]
+
+    for label, func in (("before (linear scan)", categorize_linear), ("after (lookup table)", categorize)):
+        started = time.perf_counter()
+        for file in files:
+            func(file)
+        elapsed = time.perf_counter() - started
+        print(f"{label}: {elapsed * 1e9 / len(files):,.0f} ns/file over {len(files):,} files")
+
+
+def benchmark_mkdir(count: int) -> None:
+    """
+    Count the mkdir()/stat() calls made creating category folders for count files,
+    per-file ensure_dir() against DirectoryCache. Moves are not performed.
+    """
+    extensions = list(EXTENSION_CATEGORY) + [".unknown", ""]
+    files = [Path(f"file_{i}{extensions[i % len(extensions)]}") for i in range(count)]
+    categories = [categorize(file) for file in files]
+    calls = {"mkdir": 0, "stat": 0}
+    real_mkdir, real_stat = os.mkdir, os.stat
+
+    def counting_mkdir(*args, **kwargs):
+        calls["mkdir"] += 1
+        return real_mkdir(*args, **kwargs)
+
+    def counting_stat(*args, **kwargs):
+        calls["stat"] += 1
+        return real_stat(*args, **kwargs)
+
+    def per_file(targets: List[Path]) -> None:
+        for target in targets:
+            ensure_dir(target)
+
+    def cached(targets: List[Path]) -> None:
+        dirs = DirectoryCache()
+        dirs.ensure_many(set(targets))
+        for target in targets:
+            dirs.ensure(target)
+
+    for label, run in (("before (ensure_dir per file)", per_file), ("after (DirectoryCache)", cached)):
+        with tempfile.TemporaryDirectory() as tmp:
+            targets = [Path(tmp) / category for category in categories]
+            calls.update(mkdir=0, stat=0)
+            os.mkdir, os.stat = counting_mkdir, counting_stat
+            started = time.perf_counter()
+            try:
+                run(targets)
+            finally:
+                os.mkdir, os.stat = real_mkdir, real_stat
+        elapsed = time.perf_counter() - started
+        print(
+            f"{label}: {calls['mkdir']:,} mkdir + {calls['stat']:,} stat "
+            f"for {count:,} files in {elapsed:.3f}s"
+        )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -245,8 +1919,7 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument(
         "--path", "-p",
         type=Path,
-        default=default_desktop(),
-        help="Target folder to organize (default: your Desktop).",
+        help="Target folder to organize (default: your Desktop; with --apply, the folder the plan was made for).",
     )
     p.add_argument(
         "--include-hidden",
@@ -263,10 +1936,134 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Extract moved archives (.zip, .tar.*, .gz, etc.) into sibling folders.",
     )
+    p.add_argument(
+        "--plan",
+        type=Path,
+        metavar="PLAN",
+        help="Write the moves this run would make to PLAN (JSON Lines) without touching any files.",
+    )
+    p.add_argument(
+        "--apply",
+        type=Path,
+        metavar="PLAN",
+        help="Execute the moves in a plan written by --plan.",
+    )
+    p.add_argument(
+        "--dedupe",
+        choices=DEDUPE_MODES,
+        help="Find byte-identical files before moving; 'report' lists them, 'hardlink' links copies to one file.",
+    )
+    p.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Also organize files in subfolders; later runs only look at what changed since the last one.",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and organize files as they arrive (inotify on Linux, polling elsewhere).",
+    )
+    p.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_WATCH_DEBOUNCE,
+        metavar="SECONDS",
+        help=f"--watch: wait until a new file is unchanged for SECONDS (default: {DEFAULT_WATCH_DEBOUNCE}).",
+    )
+    p.add_argument(
+        "--extract-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Extract up to N archives in parallel processes (default: CPU count).",
+    )
+    p.add_argument(
+        "--max-extract-bytes",
+        type=int,
+        default=DEFAULT_MAX_EXTRACT_BYTES,
+        metavar="BYTES",
+        help="Skip archives that expand to more than BYTES (default: 4 GiB).",
+    )
+    p.add_argument(
+        "--max-extract-entries",
+        type=int,
+        default=DEFAULT_MAX_EXTRACT_ENTRIES,
+        metavar="N",
+        help=f"Skip archives with more than N entries (default: {DEFAULT_MAX_EXTRACT_ENTRIES:,}).",
+    )
     p.add_argument(
         "--undo",
+        nargs="?",
+        const=UNDO_ALL,
+        metavar="RUN_ID",
+        help="Undo the moves of run RUN_ID, or every logged move if no run id is given.",
+    )
+    p.add_argument(
+        "--undo-last",
+        action="store_true",
+        help="Undo only the most recent run that has not been undone yet.",
+    )
+    p.add_argument(
+        "--list-runs",
         action="store_true",
-        help="Undo the most recent set of moves recorded in the log.",
+        help="List the runs recorded in the move journal and exit.",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Categorize and move files on N threads (default: 1).",
+    )
+    p.add_argument(
+        "--copy-workers",
+        type=int,
+        default=2,
+        metavar="N",
+        help="At most N cross-device copies at once (default: 2).",
+    )
+    p.add_argument(
+        "--verify-copies",
+        action="store_true",
+        help="Compare BLAKE2 digests of cross-device copies before removing the original.",
+    )
+    p.add_argument(
+        "--sniff",
+        action="store_true",
+        help="Categorize files with an unknown or missing extension by their magic number.",
+    )
+    p.add_argument(
+        "--benchmark-categorize",
+        type=int,
+        metavar="N",
+        help="Time categorization of N synthetic file names (before/after the lookup table) and exit.",
+    )
+    p.add_argument(
+        "--benchmark-mkdir",
+        type=int,
+        metavar="N",
+        help="Count the mkdir/stat calls for category folders of N synthetic files (before/after caching) and exit.",
+    )
+    output = p.add_mutually_exclusive_group()
+    output.add_argument(
+        "--verbose", "-v",
+        dest="verbosity",
+        action="store_const",
+        const=VERBOSE,
+        default=NORMAL,
+        help="List every file moved, skipped, extracted or undone.",
+    )
+    output.add_argument(
+        "--quiet", "-q",
+        dest="verbosity",
+        action="store_const",
+        const=QUIET,
+        help="Only print warnings and errors.",
+    )
+    p.add_argument(
+        "--events",
+        metavar="FILE",
+        help="Append every event as a JSON line to FILE ('-' for stdout; other output then goes to stderr).",
     )
     return p
 
@@ -274,11 +2071,70 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Optional[List[str]] = None) -> int:
     args = build_parser().parse_args(argv)
 
-    root: Path = args.path.expanduser().resolve()
-    print(f"Target folder: {root}")
+    if args.benchmark_categorize:
+        benchmark_categorize(args.benchmark_categorize)
+        return 0
+    if args.benchmark_mkdir:
+        benchmark_mkdir(args.benchmark_mkdir)
+        return 0
+
+    report.configure(level=args.verbosity, events_path=args.events)
+    try:
+        return run(args)
+    finally:
+        report.close()
+
+
+def run(args: argparse.Namespace) -> int:
+    root: Path = (args.path or default_desktop()).expanduser().resolve()
+    if args.apply:
+        # The plan's paths, journal and run index all belong to the folder it was made for
+        try:
+            planned_root = plan_root(args.apply)
+        except (OSError, ValueError) as e:
+            report.warning(f"Error: cannot read plan: {e}", event="error")
+            return 2
+        if args.path is not None and root != planned_root:
+            report.warning(
+                f"Error: {args.apply} is a plan for {planned_root}, not {root} (leave out --path to use it)",
+                event="error",
+            )
+            return 2
+        root = planned_root
+    report.info(f"Target folder: {root}", event="start", root=str(root))
+
+    if args.list_runs:
+        list_runs(root)
+        return 0
+
+    if args.undo or args.undo_last:
+        run_id = None if args.undo in (None, UNDO_ALL) else args.undo
+        undo_moves(root, dry_run=args.dry_run, run_id=run_id, last=args.undo_last)
+        return 0
+
+    if args.apply:
+        apply_plan(
+            root=root,
+            plan_path=args.apply,
+            workers=max(1, args.workers),
+            extract_archives=args.extract_archives,
+            copy_workers=args.copy_workers,
+            verify_copies=args.verify_copies,
+            extract_workers=args.extract_workers,
+            max_extract_bytes=args.max_extract_bytes,
+            max_extract_entries=args.max_extract_entries,
+        )
+        return 0
 
-    if args.undo:
-        undo_moves(root, dry_run=args.dry_run)
+    if args.watch:
+        watch(
+            root=root,
+            dry_run=args.dry_run,
+            include_hidden=args.include_hidden,
+            extract_archives=args.extract_archives,
+            sniff=args.sniff,
+            debounce=args.debounce,
+        )
         return 0
 
     organize(
@@ -286,6 +2142,16 @@ def main(argv: Optional[List[str]] = None) -> int:
         dry_run=args.dry_run,
         include_hidden=args.include_hidden,
         extract_archives=args.extract_archives,
+        workers=max(1, args.workers),
+        sniff=args.sniff,
+        copy_workers=args.copy_workers,
+        verify_copies=args.verify_copies,
+        extract_workers=args.extract_workers,
+        max_extract_bytes=args.max_extract_bytes,
+        max_extract_entries=args.max_extract_entries,
+        recursive=args.recursive,
+        dedupe=args.dedupe,
+        plan_path=args.plan,
     )
     return 0
 
@@ -6,8 +6,52 @@ quit()  # NOTE: this is here because I honestly do not want to run this, I'm jus
 # ---------------------------------------------------------------------------------------------------------------------
 
 from pathlib import Path
+import json
 import shutil
 
+# Magic numbers for files whose extension is missing or unknown (only the first few bytes are read).
+# Off by default: set SNIFF_UNKNOWN = True to sort those files by their contents too.
+SNIFF_UNKNOWN = False
+SNIFF_CACHE_NAME = ".grok_sniff_cache.json"  # results by (inode, mtime, size), so unchanged files are read only once
+HEADER_BYTES = 16
+MAGIC_NUMBERS = { "Images": [b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF87a", b"GIF89a", b"BM"]
+                 ,"Documents": [b"%PDF-", b"{\\rtf"]
+                 ,"Zip_Archives": [b"PK\x03\x04", b"Rar!\x1a\x07", b"7z\xbc\xaf\x27\x1c"]  }
+
+def load_sniff_cache(desktop):
+    try:
+        return json.loads((desktop / SNIFF_CACHE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def save_sniff_cache(desktop, cache):
+    try:
+        (desktop / SNIFF_CACHE_NAME).write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        print(f"Error saving {SNIFF_CACHE_NAME}: {type(e).__name__} - {e}")
+
+def sniff_category(file_path, cache):
+    try:
+        st = file_path.stat()
+    except OSError:
+        return None
+    key = f"{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+    if key in cache:
+        return cache[key]
+
+    try:
+        with file_path.open("rb") as f:
+            header = f.read(HEADER_BYTES)
+    except OSError:
+        return None
+    category = None
+    for name, signatures in MAGIC_NUMBERS.items():
+        if header.startswith(tuple(signatures)):
+            category = name
+            break
+    cache[key] = category
+    return category
+
 def organize_desktop():
     # Get desktop path (Windows)
     desktop = Path.home() / "Desktop"
@@ -22,9 +66,11 @@ def organize_desktop():
         folder_path = desktop / category
         folder_path.mkdir(exist_ok=True)
     
+    sniff_cache = load_sniff_cache(desktop) if SNIFF_UNKNOWN else {}
+
     # Iterate through desktop files
     for file_path in desktop.iterdir():
-        if file_path.is_file():  # Process only files
+        if file_path.is_file() and file_path.name != SNIFF_CACHE_NAME:  # Process only files
             extension = file_path.suffix.lower()
             for category, extensions in categories.items():
                 if extension in extensions:
@@ -36,7 +82,19 @@ def organize_desktop():
                         print(f"Error moving {file_path.name}: {type(e).__name__} - {e}")
                     break
             else:
-                print(f"Skipped {file_path.name}: Unknown extension {extension}")
+                category = sniff_category(file_path, sniff_cache) if SNIFF_UNKNOWN else None
+                if category is None:
+                    print(f"Skipped {file_path.name}: Unknown extension {extension}")
+                    continue
+                try:
+                    destination = desktop / category / file_path.name
+                    shutil.move(str(file_path), str(destination))
+                    print(f"Moved {file_path.name} to {category} (detected from file contents)")
+                except Exception as e:
+                    print(f"Error moving {file_path.name}: {type(e).__name__} - {e}")
+
+    if SNIFF_UNKNOWN:
+        save_sniff_cache(desktop, sniff_cache)
 
 if __name__ == "__main__":
     print(f"Organizing files on {Path.home() / 'Desktop'}")